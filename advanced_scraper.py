@@ -51,6 +51,8 @@ class AdvancedScraper:
             output_format: 'json', 'html', 'text', 'markdown', 'structured'
         """
         proxy = proxy_manager.get_next_proxy() if proxy_manager.proxies else None
+        # Strategies and the anti-bot engines take plain proxy dicts
+        proxy = proxy._asdict() if proxy else None
         
         # Auto-select best strategy
         if strategy == "auto":
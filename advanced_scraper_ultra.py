@@ -10,6 +10,7 @@ import logging
 from typing import Dict, List, Optional, Union, Any
 from urllib.parse import urlparse
 from datetime import datetime
+from dataclasses import asdict
 
 # Import all optimization modules
 from dns_optimizer import dns_optimizer
@@ -255,7 +256,7 @@ class UltraAdvancedScraper:
                 'success': True,
                 'html': html,
                 'url': driver.current_url,
-                'device': self.mobile.current_device,
+                'device': asdict(self.mobile.current_device) if self.mobile.current_device else None,
                 'strategy': 'mobile'
             }
             
@@ -504,7 +505,7 @@ class UltraAdvancedScraper:
         # Mobile emulation
         mobile_emulation = {
             "deviceMetrics": {"width": 375, "height": 812, "pixelRatio": 3.0},
-            "userAgent": self.mobile.current_device['userAgent'] if self.mobile.current_device else None
+            "userAgent": self.mobile.current_device.user_agent if self.mobile.current_device else None
         }
         options.add_experimental_option("mobileEmulation", mobile_emulation)
         
@@ -52,7 +52,7 @@ def scrape():
         proxy_dict = proxy_manager.get_next_proxy()
         if proxy_dict:
             proxy = proxy_dict
-            proxy_info = f"Proxy from {proxy_dict.get('country', 'Unknown')} - {proxy_dict.get('address', 'Unknown')}"
+            proxy_info = f"Proxy from {proxy_dict.country} - {proxy_dict.address or 'Unknown'}"
             print(f"Using proxy: {proxy_info}")
     
     # Choose scraping method based on checkbox
@@ -186,7 +186,7 @@ def background_scrape_job(job_id, url, destination, use_dynamic, webhook_url):
             proxy_dict = proxy_manager.get_next_proxy()
             if proxy_dict:
                 proxy = proxy_dict
-                proxy_info = f"Session {proxy_dict.get('session_id', 'Unknown')}"
+                proxy_info = f"Session {proxy_dict.session_id}"
         
         # Perform scraping
         if use_dynamic:
@@ -87,7 +87,7 @@ def process_scraping_job(job):
         # Rotate proxy if requested
         if job['proxy_rotation'] and proxy_manager.proxies:
             proxy = proxy_manager.get_next_proxy()
-            jobs_status[job_id]['proxy_used'] = f"Session {proxy.get('session_id', 'Unknown')}"
+            jobs_status[job_id]['proxy_used'] = f"Session {proxy.session_id}"
         
         # Execute scraping with advanced engine
         result = advanced_scraper.scrape(
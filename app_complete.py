@@ -286,7 +286,7 @@ def process_advanced_job(job):
         proxy = None
         if job['options'].get('use_proxy', True):
             proxy = proxy_manager.get_next_proxy()
-            job['proxy_used'] = f"Session {proxy.get('session_id', 'Unknown')}"
+            job['proxy_used'] = f"Session {proxy.session_id}"
         
         # Execute scraping
         result = advanced_scraper.scrape(
@@ -437,12 +437,7 @@ def initialize_app():
     print(f"✅ Loaded {len(proxy_manager.proxies)} proxies")
     
     # Initialize default recipes
-    if len(recipe_manager.recipes) == 0:
-        for recipe_data in DEFAULT_RECIPES:
-            recipe_manager.create_recipe(
-                name=recipe_data["name"],
-                config=recipe_data["config"]
-            )
+    if recipe_manager.seed_defaults():
         print(f"✅ Created {len(DEFAULT_RECIPES)} default recipes")
     
     # Start scheduler
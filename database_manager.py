@@ -150,6 +150,35 @@ class DatabaseManager:
             print(f"❌ Failed to fetch scrape by job ID: {e}")
             return None
     
+    def execute(self, query, params=None):
+        """Run one statement and commit it"""
+        try:
+            if not self.connection:
+                if not self.connect():
+                    return False
+            
+            self.cursor.execute(query, params)
+            self.connection.commit()
+            return True
+        except Exception as e:
+            print(f"❌ Failed to execute query: {e}")
+            self.connection.rollback()
+            return False
+    
+    def fetch_one(self, query, params=None):
+        """Run a query and return its first row"""
+        try:
+            if not self.connection:
+                if not self.connect():
+                    return None
+            
+            self.cursor.execute(query, params)
+            return self.cursor.fetchone()
+        except Exception as e:
+            print(f"❌ Failed to fetch row: {e}")
+            self.connection.rollback()
+            return None
+
     def close(self):
         """Close database connection"""
         try:
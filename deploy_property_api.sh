@@ -8,7 +8,7 @@ echo ""
 
 # Upload the new API file
 echo "📤 Uploading property API..."
-scp -i ~/.ssh/publicrecords_key property_owner_api.py root@164.92.90.183:/opt/web-scraper/
+scp -i ~/.ssh/publicrecords_key property_owner_api.py property_wsgi.py property_gunicorn_config.py root@164.92.90.183:/opt/web-scraper/
 
 # Connect and start the service
 ssh -i ~/.ssh/publicrecords_key root@164.92.90.183 << 'REMOTE_COMMANDS'
@@ -17,7 +17,11 @@ cd /opt/web-scraper
 
 # Install any additional dependencies
 source venv/bin/activate
-pip install redis
+pip install redis gunicorn
+
+# Every Gunicorn worker must share one API key; Gunicorn refuses to start without it
+echo "Getting API key..."
+grep "^PROPERTY_API_KEY=" /opt/web-scraper/.env || echo "PROPERTY_API_KEY=property-$(openssl rand -hex 16)" >> /opt/web-scraper/.env
 
 # Create systemd service for property API
 cat > /etc/systemd/system/property-api.service << 'EOF'
@@ -35,7 +39,8 @@ Environment="PATH=/opt/web-scraper/venv/bin"
 Environment="PROPERTY_PORT=5002"
 Environment="REDIS_HOST=localhost"
 Environment="REDIS_PORT=6379"
-ExecStart=/opt/web-scraper/venv/bin/python property_owner_api.py
+EnvironmentFile=/opt/web-scraper/.env
+ExecStart=/opt/web-scraper/venv/bin/gunicorn -c property_gunicorn_config.py property_wsgi:application
 Restart=always
 RestartSec=10
 
@@ -79,11 +84,6 @@ systemctl start property-api
 ln -sf /etc/nginx/sites-available/property-api /etc/nginx/sites-enabled/
 nginx -t && systemctl reload nginx
 
-# Get the API key
-echo ""
-echo "Getting API key..."
-grep "^PROPERTY_API_KEY=" /opt/web-scraper/.env || echo "PROPERTY_API_KEY=property-$(openssl rand -hex 16)" >> /opt/web-scraper/.env
-
 # Check status
 sleep 3
 systemctl status property-api --no-pager | head -10
@@ -0,0 +1,162 @@
+"""
+Driver Pool
+Bounded pool of warm Selenium Chrome drivers shared across requests
+"""
+import logging
+import queue
+import threading
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Page script that clears the current tab's sessionStorage, which CDP
+# Storage.clearDataForOrigin doesn't cover; opaque origins throw on access
+CLEAR_SESSION_STORAGE_SCRIPT = "try { window.sessionStorage.clear(); } catch (e) {}"
+
+
+class NoDriverAvailable(RuntimeError):
+    """Raised when every pooled driver stays checked out past the acquire timeout"""
+
+
+def _origin(url: str):
+    """scheme://host[:port] of an http(s) URL, None for anything else"""
+    parts = urlsplit(url or '')
+    if parts.scheme in ('http', 'https') and parts.netloc:
+        return f"{parts.scheme}://{parts.netloc}"
+    return None
+
+
+def _frame_origins(frame_tree: dict) -> list:
+    """Security origins of a Page.getFrameTree frame and all its child frames"""
+    origins = [frame_tree['frame'].get('securityOrigin')]
+    for child in frame_tree.get('childFrames', ()):
+        origins.extend(_frame_origins(child))
+    return origins
+
+
+class DriverPool:
+    """
+    Bounded pool of warm Chrome drivers checked out per request.
+
+    Drivers are launched on demand up to size. release() clears every
+    cookie and the storage of each origin the driver visited, so the next
+    caller gets a browser as clean as a fresh one. With max_uses, a driver
+    is quit after serving that many requests.
+    """
+
+    def __init__(self, factory, size: int, max_uses: int = None):
+        self._factory = factory
+        self._size = size
+        self._max_uses = max_uses
+        self._idle = queue.Queue()
+        self._uses = {}     # driver -> requests served, for every live driver
+        self._origins = {}  # driver -> origins visited since the last reset
+        self._creating = 0
+        self._lock = threading.Lock()
+
+    def _create(self):
+        """Create a new driver if the pool has room, otherwise return None"""
+        with self._lock:
+            if len(self._uses) + self._creating >= self._size:
+                return None
+            # Reserve the slot before the (slow) browser launch
+            self._creating += 1
+
+        try:
+            driver = self._factory()
+        except Exception:
+            with self._lock:
+                self._creating -= 1
+            raise
+
+        with self._lock:
+            self._creating -= 1
+            self._uses[driver] = 0
+            self._origins[driver] = set()
+        return driver
+
+    def prewarm(self):
+        """Launch drivers up to the pool size ahead of the first request"""
+        while True:
+            driver = self._create()
+            if driver is None:
+                break
+            self._idle.put(driver)
+
+    def acquire(self, timeout: float = 30):
+        """Check out an idle driver, launching one if the pool is not full"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        driver = self._create()
+        if driver is not None:
+            return driver
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise NoDriverAvailable(f"No browser available within {timeout}s (pool size {self._size})")
+
+    def navigate(self, driver, url: str):
+        """Load url in a checked-out driver, remembering its origin for the reset"""
+        origin = _origin(url)
+        if origin:
+            self._origins.setdefault(driver, set()).add(origin)
+        driver.get(url)
+
+    def release(self, driver):
+        """Reset browser state and return the driver, or retire it once worn out"""
+        with self._lock:
+            self._uses[driver] = self._uses.get(driver, 0) + 1
+            worn_out = self._max_uses is not None and self._uses[driver] >= self._max_uses
+        if worn_out:
+            self.discard(driver)
+            return
+
+        try:
+            self._reset(driver)
+        except Exception as e:
+            logger.warning(f"Discarding unhealthy driver: {e}")
+            self.discard(driver)
+            return
+
+        self._idle.put(driver)
+
+    def _reset(self, driver):
+        """Clear cookies for all sites and storage for every origin the driver saw"""
+        origins = self._origins.setdefault(driver, set())
+        origins.add(_origin(driver.current_url))
+        frame_tree = driver.execute_cdp_cmd('Page.getFrameTree', {})['frameTree']
+        origins.update(_origin(origin) for origin in _frame_origins(frame_tree))
+        origins.discard(None)
+
+        driver.execute_script(CLEAR_SESSION_STORAGE_SCRIPT)
+        driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        for origin in origins:
+            driver.execute_cdp_cmd('Storage.clearDataForOrigin', {'origin': origin, 'storageTypes': 'all'})
+        origins.clear()
+
+        driver.get('about:blank')
+
+    def discard(self, driver):
+        """Quit a driver and free its slot"""
+        with self._lock:
+            self._uses.pop(driver, None)
+            self._origins.pop(driver, None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close(self):
+        """Quit every driver owned by the pool"""
+        with self._lock:
+            drivers = list(self._uses)
+            self._uses.clear()
+            self._origins.clear()
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
@@ -3,88 +3,301 @@ Mobile Device Simulation Module
 Implements realistic touch events, device sensors, and mobile-specific behaviors
 """
 
+import asyncio
 import random
 import time
 import math
 import json
-from typing import Dict, List, Tuple, Optional
-import numpy as np
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.common.touch_actions import TouchActions
+from collections import deque
+from dataclasses import dataclass, asdict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Tuple, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+@dataclass(frozen=True, slots=True)
+class Viewport:
+    """Viewport or screen dimensions in CSS pixels"""
+    width: int
+    height: int
+
+
+@dataclass(frozen=True, slots=True)
+class Orientation:
+    """Screen orientation as reported by the Screen Orientation API"""
+    angle: int
+    type: str
+
+
+@dataclass(frozen=True, slots=True)
+class Battery:
+    """Battery state exposed through navigator.getBattery()"""
+    level: float
+    charging: bool
+
+
+@dataclass(frozen=True, slots=True)
+class Connection:
+    """Network information exposed through navigator.connection"""
+    effective_type: str
+    rtt: int
+    downlink: float
+
+
+@dataclass(frozen=True, slots=True)
+class DeviceProfile:
+    """Immutable mobile device profile"""
+    name: str
+    viewport: Viewport
+    screen: Viewport
+    device_scale_factor: float
+    user_agent: str
+    has_touch: bool
+    is_mobile: bool
+    platform: str
+    touch_points: int
+    orientation: Orientation
+    battery: Battery
+    connection: Connection
+
+
+# Device profiles are built once at import and shared by every simulator
+DEVICE_PROFILES = MappingProxyType({
+    profile.name: profile for profile in (
+        DeviceProfile(
+            name='iPhone 15 Pro',
+            viewport=Viewport(393, 852),
+            screen=Viewport(393, 852),
+            device_scale_factor=3,
+            user_agent='Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) AppleWebKit/605.1.15',
+            has_touch=True,
+            is_mobile=True,
+            platform='iOS',
+            touch_points=5,
+            orientation=Orientation(0, 'portrait-primary'),
+            battery=Battery(0.85, False),
+            connection=Connection('4g', 50, 10)
+        ),
+        DeviceProfile(
+            name='Samsung Galaxy S24',
+            viewport=Viewport(412, 915),
+            screen=Viewport(412, 915),
+            device_scale_factor=2.625,
+            user_agent='Mozilla/5.0 (Linux; Android 14; SM-S928B) AppleWebKit/537.36',
+            has_touch=True,
+            is_mobile=True,
+            platform='Android',
+            touch_points=10,
+            orientation=Orientation(0, 'portrait-primary'),
+            battery=Battery(0.72, True),
+            connection=Connection('5g', 30, 50)
+        ),
+        DeviceProfile(
+            name='iPad Pro',
+            viewport=Viewport(1024, 1366),
+            screen=Viewport(1024, 1366),
+            device_scale_factor=2,
+            user_agent='Mozilla/5.0 (iPad; CPU OS 17_0 like Mac OS X) AppleWebKit/605.1.15',
+            has_touch=True,
+            is_mobile=True,
+            platform='iOS',
+            touch_points=5,
+            orientation=Orientation(0, 'landscape-primary'),
+            battery=Battery(0.95, True),
+            connection=Connection('wifi', 10, 100)
+        ),
+        DeviceProfile(
+            name='Google Pixel 8',
+            viewport=Viewport(412, 869),
+            screen=Viewport(412, 869),
+            device_scale_factor=2.625,
+            user_agent='Mozilla/5.0 (Linux; Android 14; Pixel 8) AppleWebKit/537.36',
+            has_touch=True,
+            is_mobile=True,
+            platform='Android',
+            touch_points=10,
+            orientation=Orientation(0, 'portrait-primary'),
+            battery=Battery(0.68, False),
+            connection=Connection('4g', 60, 8)
+        ),
+    )
+})
+_DEVICE_PROFILE_CHOICES = tuple(DEVICE_PROFILES.values())
+
+
+def _network_conditions(downlink_mbps: float, rtt: int, connection_type: str) -> Dict:
+    """Build Network.emulateNetworkConditions params for a connection profile"""
+    return {
+        'offline': connection_type == 'none',
+        'downloadThroughput': downlink_mbps * 1024 * 1024 / 8,
+        'uploadThroughput': downlink_mbps * 1024 * 1024 / 16,
+        'latency': rtt,
+        'connectionType': connection_type
+    }
+
+
+# CDP network condition params, precomputed once per connection profile
+NETWORK_PROFILES = MappingProxyType({
+    'wifi': _network_conditions(30, 10, 'wifi'),
+    '4g': _network_conditions(10, 50, 'cellular4g'),
+    '3g': _network_conditions(1.5, 100, 'cellular3g'),
+    'slow-2g': _network_conditions(0.05, 300, 'cellular2g'),
+    'offline': _network_conditions(0, 0, 'none')
+})
+_NETWORK_PROFILE_NAMES = tuple(NETWORK_PROFILES)
+
+# Navigator overrides; per-device values arrive as a JSON argument so the
+# script source stays constant and hits the browser's compile cache.
+# arguments[1] and arguments[2] carry the per-call battery timings.
+MOBILE_OVERRIDE_SCRIPT = """
+const cfg = JSON.parse(arguments[0]);
+
+Object.defineProperty(navigator, 'maxTouchPoints', {
+    get: () => cfg.touchPoints
+});
+
+Object.defineProperty(navigator, 'platform', {
+    get: () => cfg.platform
+});
+
+// Touch event support
+window.ontouchstart = null;
+window.ontouchmove = null;
+window.ontouchend = null;
+
+// Device motion and orientation
+window.DeviceOrientationEvent = function() {};
+window.DeviceMotionEvent = function() {};
+
+// Battery API
+navigator.getBattery = async () => ({
+    level: cfg.battery.level,
+    charging: cfg.battery.charging,
+    chargingTime: arguments[1],
+    dischargingTime: arguments[2]
+});
+
+// Network Information API
+Object.defineProperty(navigator, 'connection', {
+    get: () => ({
+        effectiveType: cfg.connection.effectiveType,
+        rtt: cfg.connection.rtt,
+        downlink: cfg.connection.downlink,
+        saveData: false
+    })
+});
+"""
+
+
+# Replays devicemotion samples ([ax, ay, az, gx, gy, gz, ra, rb, rg]) on
+# animation frames at the requested interval, so a whole trace costs a
+# single WebDriver round-trip. Runs as an async script and reports
+# {dispatched, error} once the trace is done or a dispatch fails.
+DEVICE_MOTION_STREAM_SCRIPT = """
+const samples = JSON.parse(arguments[0]);
+const interval = arguments[1];
+const done = arguments[arguments.length - 1];
+let index = 0;
+let last = 0;
+
+// MOBILE_OVERRIDE_SCRIPT replaces the DeviceMotionEvent constructor, so
+// build a plain Event and attach the motion fields to it
+function motionEvent(s) {
+    const event = new Event('devicemotion');
+    Object.defineProperties(event, {
+        acceleration: {value: {x: s[0], y: s[1], z: s[2]}},
+        accelerationIncludingGravity: {value: {x: s[3], y: s[4], z: s[5]}},
+        rotationRate: {value: {alpha: s[6], beta: s[7], gamma: s[8]}},
+        interval: {value: interval}
+    });
+    return event;
+}
+
+function step(now) {
+    if (now - last >= interval) {
+        last = now;
+        try {
+            window.dispatchEvent(motionEvent(samples[index]));
+        } catch (e) {
+            done({dispatched: index, error: String(e)});
+            return;
+        }
+        index++;
+    }
+    if (index < samples.length) {
+        requestAnimationFrame(step);
+    } else {
+        done({dispatched: index, error: null});
+    }
+}
+
+if (samples.length) {
+    requestAnimationFrame(step);
+} else {
+    done({dispatched: 0, error: null});
+}
+"""
+
+
+@lru_cache(maxsize=128)
+def _bezier_basis(steps: int) -> Tuple[Tuple[float, float, float, float, float], ...]:
+    """Cubic bezier weights and swipe pressure for each step"""
+    basis = []
+    for i in range(steps):
+        t = i / (steps - 1)
+        # Pressure curve (higher in middle)
+        pressure = 0.3 + 0.4 * math.sin(t * math.pi)
+        basis.append(((1-t)**3, 3*(1-t)**2*t, 3*(1-t)*t**2, t**3, pressure))
+    return tuple(basis)
+
+
+@lru_cache(maxsize=128)
+def _ease_out_curve(steps: int) -> Tuple[Tuple[float, float], ...]:
+    """Scroll progress and pressure for each step"""
+    curve = []
+    for i in range(steps):
+        t = i / (steps - 1)
+        # Ease-out curve for deceleration; pressure decreases over time
+        curve.append((1 - (1 - t) ** 3, 0.5 * (1 - t * 0.5)))
+    return tuple(curve)
+
+
+@lru_cache(maxsize=None)
+def _device_override_config(device: DeviceProfile) -> str:
+    """Serialize the device-constant part of the navigator overrides once per profile"""
+    return json.dumps({
+        'touchPoints': device.touch_points,
+        'platform': device.platform,
+        'battery': {
+            'level': device.battery.level,
+            'charging': device.battery.charging
+        },
+        'connection': {
+            'effectiveType': device.connection.effective_type,
+            'rtt': device.connection.rtt,
+            'downlink': device.connection.downlink
+        }
+    })
+
 class MobileSimulator:
     """Simulates mobile device interactions and sensors"""
     
     def __init__(self):
-        self.device_profiles = {
-            'iPhone 15 Pro': {
-                'viewport': {'width': 393, 'height': 852},
-                'screen': {'width': 393, 'height': 852},
-                'deviceScaleFactor': 3,
-                'userAgent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) AppleWebKit/605.1.15',
-                'hasTouch': True,
-                'isMobile': True,
-                'platform': 'iOS',
-                'touchPoints': 5,
-                'orientation': {'angle': 0, 'type': 'portrait-primary'},
-                'battery': {'level': 0.85, 'charging': False},
-                'connection': {'effectiveType': '4g', 'rtt': 50, 'downlink': 10}
-            },
-            'Samsung Galaxy S24': {
-                'viewport': {'width': 412, 'height': 915},
-                'screen': {'width': 412, 'height': 915},
-                'deviceScaleFactor': 2.625,
-                'userAgent': 'Mozilla/5.0 (Linux; Android 14; SM-S928B) AppleWebKit/537.36',
-                'hasTouch': True,
-                'isMobile': True,
-                'platform': 'Android',
-                'touchPoints': 10,
-                'orientation': {'angle': 0, 'type': 'portrait-primary'},
-                'battery': {'level': 0.72, 'charging': True},
-                'connection': {'effectiveType': '5g', 'rtt': 30, 'downlink': 50}
-            },
-            'iPad Pro': {
-                'viewport': {'width': 1024, 'height': 1366},
-                'screen': {'width': 1024, 'height': 1366},
-                'deviceScaleFactor': 2,
-                'userAgent': 'Mozilla/5.0 (iPad; CPU OS 17_0 like Mac OS X) AppleWebKit/605.1.15',
-                'hasTouch': True,
-                'isMobile': True,
-                'platform': 'iOS',
-                'touchPoints': 5,
-                'orientation': {'angle': 0, 'type': 'landscape-primary'},
-                'battery': {'level': 0.95, 'charging': True},
-                'connection': {'effectiveType': 'wifi', 'rtt': 10, 'downlink': 100}
-            },
-            'Google Pixel 8': {
-                'viewport': {'width': 412, 'height': 869},
-                'screen': {'width': 412, 'height': 869},
-                'deviceScaleFactor': 2.625,
-                'userAgent': 'Mozilla/5.0 (Linux; Android 14; Pixel 8) AppleWebKit/537.36',
-                'hasTouch': True,
-                'isMobile': True,
-                'platform': 'Android',
-                'touchPoints': 10,
-                'orientation': {'angle': 0, 'type': 'portrait-primary'},
-                'battery': {'level': 0.68, 'charging': False},
-                'connection': {'effectiveType': '4g', 'rtt': 60, 'downlink': 8}
-            }
-        }
+        self.device_profiles = DEVICE_PROFILES
+        self.current_device: Optional[DeviceProfile] = None
+        # Bounded ring buffer of (timestamp, gesture, x, y) tuples
+        self.touch_history = deque(maxlen=1000)
         
-        self.current_device = None
-        self.touch_history = []
-        
-    def select_device(self, device_name: str = None) -> Dict:
+    def select_device(self, device_name: str = None) -> DeviceProfile:
         """Select a mobile device profile"""
         if device_name and device_name in self.device_profiles:
             self.current_device = self.device_profiles[device_name]
         else:
-            self.current_device = random.choice(list(self.device_profiles.values()))
+            self.current_device = random.choice(_DEVICE_PROFILE_CHOICES)
         
-        logger.info(f"Selected device profile: {self.current_device.get('platform')}")
+        logger.info(f"Selected device profile: {self.current_device.platform}")
         return self.current_device
     
     def inject_mobile_overrides(self, driver) -> bool:
@@ -92,91 +305,37 @@ class MobileSimulator:
         if not self.current_device:
             self.select_device()
         
+        device = self.current_device
+        
         try:
             # Override navigator properties
-            override_script = """
-            Object.defineProperty(navigator, 'maxTouchPoints', {
-                get: () => %d
-            });
-            
-            Object.defineProperty(navigator, 'platform', {
-                get: () => '%s'
-            });
-            
-            // Touch event support
-            window.ontouchstart = null;
-            window.ontouchmove = null;
-            window.ontouchend = null;
-            
-            // Device motion and orientation
-            window.DeviceOrientationEvent = function() {};
-            window.DeviceMotionEvent = function() {};
-            
-            // Battery API
-            navigator.getBattery = async () => ({
-                level: %f,
-                charging: %s,
-                chargingTime: %d,
-                dischargingTime: %d
-            });
-            
-            // Network Information API
-            Object.defineProperty(navigator, 'connection', {
-                get: () => ({
-                    effectiveType: '%s',
-                    rtt: %d,
-                    downlink: %f,
-                    saveData: false
-                })
-            });
-            
-            // Geolocation with mobile accuracy
-            const originalGeolocation = navigator.geolocation.getCurrentPosition;
-            navigator.geolocation.getCurrentPosition = function(success, error, options) {
-                const position = {
-                    coords: {
-                        latitude: %f + (Math.random() - 0.5) * 0.001,
-                        longitude: %f + (Math.random() - 0.5) * 0.001,
-                        accuracy: %f,
-                        altitude: null,
-                        altitudeAccuracy: null,
-                        heading: Math.random() * 360,
-                        speed: Math.random() * 2
-                    },
-                    timestamp: Date.now()
-                };
-                setTimeout(() => success(position), Math.random() * 2000 + 500);
-            };
-            """ % (
-                self.current_device['touchPoints'],
-                self.current_device['platform'],
-                self.current_device['battery']['level'],
-                'true' if self.current_device['battery']['charging'] else 'false',
+            driver.execute_script(
+                MOBILE_OVERRIDE_SCRIPT,
+                _device_override_config(device),
                 random.randint(0, 7200),  # Charging time
-                random.randint(3600, 28800),  # Discharging time
-                self.current_device['connection']['effectiveType'],
-                self.current_device['connection']['rtt'],
-                self.current_device['connection']['downlink'],
-                37.7749 + random.uniform(-0.1, 0.1),  # Latitude (San Francisco + variation)
-                -122.4194 + random.uniform(-0.1, 0.1),  # Longitude
-                random.uniform(5, 50)  # GPS accuracy in meters
+                random.randint(3600, 28800)  # Discharging time
             )
             
-            driver.execute_script(override_script)
+            # Geolocation with mobile accuracy, handled natively by the browser
+            driver.execute_cdp_cmd('Emulation.setGeolocationOverride', {
+                'latitude': 37.7749 + random.uniform(-0.1, 0.1),  # San Francisco + variation
+                'longitude': -122.4194 + random.uniform(-0.1, 0.1),
+                'accuracy': random.uniform(5, 50)  # GPS accuracy in meters
+            })
             
             # Set viewport and device metrics
             driver.execute_cdp_cmd('Emulation.setDeviceMetricsOverride', {
-                'width': self.current_device['viewport']['width'],
-                'height': self.current_device['viewport']['height'],
-                'deviceScaleFactor': self.current_device['deviceScaleFactor'],
-                'mobile': self.current_device['isMobile'],
-                'screenOrientation': self.current_device['orientation']
+                'width': device.viewport.width,
+                'height': device.viewport.height,
+                'deviceScaleFactor': device.device_scale_factor,
+                'mobile': device.is_mobile,
+                'screenOrientation': asdict(device.orientation)
             })
             
             # Enable touch emulation
             driver.execute_cdp_cmd('Emulation.setTouchEmulationEnabled', {
                 'enabled': True,
-                'maxTouchPoints': self.current_device['touchPoints']
+                'maxTouchPoints': device.touch_points
             })
             
             return True
@@ -213,16 +372,10 @@ class MobileSimulator:
                 start[1] + (end[1] - start[1]) * 0.7 + random.randint(-20, 20)
             )
             
-            for i in range(steps):
-                t = i / (steps - 1)
+            for b0, b1, b2, b3, pressure in _bezier_basis(steps):
                 # Cubic bezier formula
-                x = (1-t)**3 * start[0] + 3*(1-t)**2*t * control1[0] + \
-                    3*(1-t)*t**2 * control2[0] + t**3 * end[0]
-                y = (1-t)**3 * start[1] + 3*(1-t)**2*t * control1[1] + \
-                    3*(1-t)*t**2 * control2[1] + t**3 * end[1]
-                
-                # Pressure curve (higher in middle)
-                pressure = 0.3 + 0.4 * math.sin(t * math.pi)
+                x = b0 * start[0] + b1 * control1[0] + b2 * control2[0] + b3 * end[0]
+                y = b0 * start[1] + b1 * control1[1] + b2 * control2[1] + b3 * end[1]
                 
                 points.append((int(x), int(y), pressure))
         
@@ -231,17 +384,10 @@ class MobileSimulator:
             duration = random.uniform(0.3, 0.8)
             steps = 30
             
-            for i in range(steps):
-                t = i / (steps - 1)
-                # Ease-out curve for deceleration
-                progress = 1 - (1 - t) ** 3
-                
+            for progress, pressure in _ease_out_curve(steps):
                 x = start[0] + (end[0] - start[0]) * progress
                 y = start[1] + (end[1] - start[1]) * progress
                 
-                # Pressure decreases over time
-                pressure = 0.5 * (1 - t * 0.5)
-                
                 points.append((int(x), int(y), pressure))
         
         elif gesture_type == 'pinch':
@@ -249,23 +395,18 @@ class MobileSimulator:
             duration = random.uniform(0.4, 0.7)
             steps = 20
             center = ((start[0] + end[0]) // 2, (start[1] + end[1]) // 2)
+            cx, cy = center
+            rand, randint = random.random, random.randint
+            # One slot per finger per step, filled in place
+            points = [None] * (2 * steps)
             
             for i in range(steps):
                 t = i / (steps - 1)
                 # Fingers move apart/together
-                distance = 50 * (1 - t) if random.random() < 0.5 else 50 * t
-                
-                finger1 = (
-                    center[0] - distance + random.randint(-3, 3),
-                    center[1] + random.randint(-3, 3)
-                )
-                finger2 = (
-                    center[0] + distance + random.randint(-3, 3),
-                    center[1] + random.randint(-3, 3)
-                )
+                distance = 50 * (1 - t) if rand() < 0.5 else 50 * t
                 
-                points.append((*finger1, 0.4))
-                points.append((*finger2, 0.4))
+                points[2 * i] = (cx - distance + randint(-3, 3), cy + randint(-3, 3), 0.4)
+                points[2 * i + 1] = (cx + distance + randint(-3, 3), cy + randint(-3, 3), 0.4)
         
         return points
     
@@ -289,11 +430,7 @@ class MobileSimulator:
                 self.perform_long_press(driver, start_x, start_y)
             
             # Record touch event
-            self.touch_history.append({
-                'timestamp': time.time(),
-                'gesture': gesture_type,
-                'location': (start_x, start_y)
-            })
+            self.touch_history.append((time.time(), gesture_type, start_x, start_y))
             
             return True
             
@@ -301,182 +438,113 @@ class MobileSimulator:
             logger.error(f"Touch simulation failed: {e}")
             return False
     
+    def _dispatch_touch(self, driver, event_type: str, touch_points: List[Dict],
+                        timestamp: float = None):
+        """Dispatch a touch event through Chrome's native input pipeline"""
+        params = {'type': event_type, 'touchPoints': touch_points}
+        if timestamp is not None:
+            params['timestamp'] = timestamp
+        driver.execute_cdp_cmd('Input.dispatchTouchEvent', params)
+    
+    def _tap_steps(self, driver, x: int, y: int) -> Iterator[float]:
+        """Dispatch a tap, yielding the pause required after each event"""
+        uniform = random.uniform
+        self._dispatch_touch(driver, 'touchStart', [{
+            'x': x,
+            'y': y,
+            'radiusX': uniform(5, 15),
+            'radiusY': uniform(5, 15),
+            'rotationAngle': uniform(0, 360),
+            'force': uniform(0.3, 0.7),
+            'id': 0
+        }])
+        yield random.randint(50, 150) / 1000  # tap duration
+        self._dispatch_touch(driver, 'touchEnd', [])
+        yield uniform(0.1, 0.3)
+    
     def perform_tap(self, driver, x: int, y: int):
         """Perform a tap at coordinates"""
-        script = """
-        var touch = new Touch({
-            identifier: Date.now(),
-            target: document.elementFromPoint(%d, %d),
-            clientX: %d,
-            clientY: %d,
-            screenX: %d,
-            screenY: %d,
-            pageX: %d,
-            pageY: %d,
-            radiusX: %f,
-            radiusY: %f,
-            rotationAngle: %f,
-            force: %f
-        });
-        
-        var touchEvent = new TouchEvent('touchstart', {
-            touches: [touch],
-            targetTouches: [touch],
-            changedTouches: [touch],
-            bubbles: true,
-            cancelable: true
-        });
-        
-        document.elementFromPoint(%d, %d).dispatchEvent(touchEvent);
-        
-        setTimeout(() => {
-            var endEvent = new TouchEvent('touchend', {
-                touches: [],
-                targetTouches: [],
-                changedTouches: [touch],
-                bubbles: true,
-                cancelable: true
-            });
-            document.elementFromPoint(%d, %d).dispatchEvent(endEvent);
-        }, %d);
-        """ % (
-            x, y, x, y, x, y, x, y,
-            random.uniform(5, 15),  # radiusX
-            random.uniform(5, 15),  # radiusY
-            random.uniform(0, 360),  # rotation
-            random.uniform(0.3, 0.7),  # force
-            x, y,
-            x, y,
-            random.randint(50, 150)  # tap duration
-        )
-        
-        driver.execute_script(script)
-        time.sleep(random.uniform(0.1, 0.3))
+        for pause in self._tap_steps(driver, x, y):
+            time.sleep(pause)
+    
+    async def perform_tap_async(self, driver, x: int, y: int) -> float:
+        """Perform a tap without blocking the event loop; returns time spent waiting"""
+        waited = 0.0
+        for pause in self._tap_steps(driver, x, y):
+            await asyncio.sleep(pause)
+            waited += pause
+        return waited
     
     def perform_swipe(self, driver, start_x: int, start_y: int, end_x: int, end_y: int):
         """Perform a swipe gesture"""
         path = self.generate_touch_path((start_x, start_y), (end_x, end_y), 'swipe')
         
-        script = """
-        var touches = [];
-        var path = %s;
-        var startTime = Date.now();
+        # Precompute event timestamps so CDP round-trip latency is absorbed
+        # into the 20ms step interval instead of stretching the gesture
+        start_time = time.time()
+        timestamps = [start_time + i * 0.02 for i in range(len(path))]
+        last = len(path) - 1
         
-        function dispatchTouchEvent(type, point, index) {
-            var touch = new Touch({
-                identifier: 1,
-                target: document.elementFromPoint(point[0], point[1]),
-                clientX: point[0],
-                clientY: point[1],
-                screenX: point[0],
-                screenY: point[1],
-                pageX: point[0],
-                pageY: point[1],
-                radiusX: 10,
-                radiusY: 10,
-                rotationAngle: 0,
-                force: point[2]
-            });
-            
-            var event = new TouchEvent(type, {
-                touches: type === 'touchend' ? [] : [touch],
-                targetTouches: type === 'touchend' ? [] : [touch],
-                changedTouches: [touch],
-                bubbles: true,
-                cancelable: true
-            });
+        for i, (x, y, pressure) in enumerate(path):
+            delay = timestamps[i] - time.time()
+            if delay > 0:
+                time.sleep(delay)
             
-            document.elementFromPoint(point[0], point[1]).dispatchEvent(event);
-        }
+            if i == last:
+                self._dispatch_touch(driver, 'touchEnd', [], timestamps[i])
+            else:
+                self._dispatch_touch(driver, 'touchStart' if i == 0 else 'touchMove', [{
+                    'x': x,
+                    'y': y,
+                    'radiusX': 10,
+                    'radiusY': 10,
+                    'rotationAngle': 0,
+                    'force': pressure,
+                    'id': 1
+                }], timestamps[i])
         
-        // Start touch
-        dispatchTouchEvent('touchstart', path[0], 0);
+        time.sleep(0.1)
+    
+    def _long_press_steps(self, driver, x: int, y: int,
+                          duration: float = None) -> Iterator[float]:
+        """Dispatch a long press, yielding the pause required after each event"""
+        uniform = random.uniform
+        if duration is None:
+            duration = uniform(0.5, 1.5)
         
-        // Move through path
-        path.slice(1, -1).forEach((point, index) => {
-            setTimeout(() => {
-                dispatchTouchEvent('touchmove', point, index + 1);
-            }, (index + 1) * 20);
-        });
+        touch_point = {
+            'x': x,
+            'y': y,
+            'radiusX': uniform(8, 20),
+            'radiusY': uniform(8, 20),
+            'rotationAngle': 0,
+            'force': 0.3,  # initial force
+            'id': 0
+        }
+        self._dispatch_touch(driver, 'touchStart', [touch_point])
         
-        // End touch
-        setTimeout(() => {
-            dispatchTouchEvent('touchend', path[path.length - 1], path.length - 1);
-        }, path.length * 20);
-        """ % json.dumps(path)
+        # Simulate pressure increase
+        yield 0.1
+        self._dispatch_touch(driver, 'touchMove', [dict(touch_point, force=0.8)])
         
-        driver.execute_script(script)
-        time.sleep(len(path) * 0.02 + 0.1)
+        # End after duration
+        yield max(duration - 0.1, 0)
+        self._dispatch_touch(driver, 'touchEnd', [])
+        yield 0.1
     
     def perform_long_press(self, driver, x: int, y: int, duration: float = None):
         """Perform a long press at coordinates"""
-        if duration is None:
-            duration = random.uniform(0.5, 1.5)
-        
-        script = """
-        var touch = new Touch({
-            identifier: Date.now(),
-            target: document.elementFromPoint(%d, %d),
-            clientX: %d,
-            clientY: %d,
-            screenX: %d,
-            screenY: %d,
-            pageX: %d,
-            pageY: %d,
-            radiusX: %f,
-            radiusY: %f,
-            rotationAngle: 0,
-            force: %f
-        });
-        
-        var startEvent = new TouchEvent('touchstart', {
-            touches: [touch],
-            targetTouches: [touch],
-            changedTouches: [touch],
-            bubbles: true,
-            cancelable: true
-        });
-        
-        document.elementFromPoint(%d, %d).dispatchEvent(startEvent);
-        
-        // Simulate pressure increase
-        setTimeout(() => {
-            touch.force = %f;
-            var moveEvent = new TouchEvent('touchmove', {
-                touches: [touch],
-                targetTouches: [touch],
-                changedTouches: [touch],
-                bubbles: true,
-                cancelable: true
-            });
-            document.elementFromPoint(%d, %d).dispatchEvent(moveEvent);
-        }, 100);
-        
-        // End after duration
-        setTimeout(() => {
-            var endEvent = new TouchEvent('touchend', {
-                touches: [],
-                targetTouches: [],
-                changedTouches: [touch],
-                bubbles: true,
-                cancelable: true
-            });
-            document.elementFromPoint(%d, %d).dispatchEvent(endEvent);
-        }, %d);
-        """ % (
-            x, y, x, y, x, y, x, y,
-            random.uniform(8, 20),  # radiusX
-            random.uniform(8, 20),  # radiusY
-            0.3,  # initial force
-            x, y,
-            0.8,  # increased force
-            x, y,
-            x, y,
-            int(duration * 1000)
-        )
-        
-        driver.execute_script(script)
-        time.sleep(duration + 0.1)
+        for pause in self._long_press_steps(driver, x, y, duration):
+            time.sleep(pause)
+    
+    async def perform_long_press_async(self, driver, x: int, y: int,
+                                       duration: float = None) -> float:
+        """Perform a long press without blocking the event loop; returns time spent waiting"""
+        waited = 0.0
+        for pause in self._long_press_steps(driver, x, y, duration):
+            await asyncio.sleep(pause)
+            waited += pause
+        return waited
     
     def simulate_device_orientation(self, driver, alpha: float = None, 
                                   beta: float = None, gamma: float = None):
@@ -502,6 +570,7 @@ class MobileSimulator:
     
     def simulate_device_motion(self, driver):
         """Simulate device motion (accelerometer)"""
+        uniform = random.uniform
         script = """
         var event = new DeviceMotionEvent('devicemotion', {
             acceleration: {
@@ -523,41 +592,65 @@ class MobileSimulator:
         });
         window.dispatchEvent(event);
         """ % (
-            random.uniform(-0.5, 0.5),  # acceleration x
-            random.uniform(-0.5, 0.5),  # acceleration y
-            random.uniform(-0.5, 0.5),  # acceleration z
-            random.uniform(-0.5, 0.5),  # with gravity x
-            random.uniform(-10, -9),    # with gravity y (gravity)
-            random.uniform(-0.5, 0.5),  # with gravity z
-            random.uniform(-5, 5),       # rotation alpha
-            random.uniform(-5, 5),       # rotation beta
-            random.uniform(-5, 5)        # rotation gamma
+            uniform(-0.5, 0.5),  # acceleration x
+            uniform(-0.5, 0.5),  # acceleration y
+            uniform(-0.5, 0.5),  # acceleration z
+            uniform(-0.5, 0.5),  # with gravity x
+            uniform(-10, -9),    # with gravity y (gravity)
+            uniform(-0.5, 0.5),  # with gravity z
+            uniform(-5, 5),       # rotation alpha
+            uniform(-5, 5),       # rotation beta
+            uniform(-5, 5)        # rotation gamma
         )
         
         driver.execute_script(script)
     
+    def stream_device_motion(self, driver, duration_s: float, hz: int = 60):
+        """
+        Play back a precomputed accelerometer trace in-browser with one call.
+        
+        Blocks until the trace has played and returns the number of events
+        dispatched; raises RuntimeError if the page fails to dispatch one.
+        """
+        uniform = random.uniform
+        samples = [
+            [
+                round(uniform(-0.5, 0.5), 4),  # acceleration x
+                round(uniform(-0.5, 0.5), 4),  # acceleration y
+                round(uniform(-0.5, 0.5), 4),  # acceleration z
+                round(uniform(-0.5, 0.5), 4),  # with gravity x
+                round(uniform(-10, -9), 4),    # with gravity y (gravity)
+                round(uniform(-0.5, 0.5), 4),  # with gravity z
+                round(uniform(-5, 5), 4),      # rotation alpha
+                round(uniform(-5, 5), 4),      # rotation beta
+                round(uniform(-5, 5), 4)       # rotation gamma
+            ]
+            for _ in range(int(duration_s * hz))
+        ]
+        
+        # The script returns once the trace has played; give it time to finish
+        previous_timeout = driver.timeouts.script
+        driver.set_script_timeout(duration_s + 10)
+        try:
+            result = driver.execute_async_script(DEVICE_MOTION_STREAM_SCRIPT, json.dumps(samples), 1000 / hz)
+        finally:
+            driver.set_script_timeout(previous_timeout)
+        
+        if result['error']:
+            raise RuntimeError(
+                f"Device motion stream stopped after {result['dispatched']}/{len(samples)} samples: {result['error']}"
+            )
+        return result['dispatched']
+    
     def simulate_network_change(self, driver, connection_type: str = None):
         """Simulate network connection changes"""
         if connection_type is None:
-            connection_type = random.choice(['wifi', '4g', '3g', 'slow-2g', 'offline'])
+            connection_type = random.choice(_NETWORK_PROFILE_NAMES)
         
-        network_profiles = {
-            'wifi': {'downlink': 30, 'rtt': 10, 'effectiveType': 'wifi'},
-            '4g': {'downlink': 10, 'rtt': 50, 'effectiveType': '4g'},
-            '3g': {'downlink': 1.5, 'rtt': 100, 'effectiveType': '3g'},
-            'slow-2g': {'downlink': 0.05, 'rtt': 300, 'effectiveType': 'slow-2g'},
-            'offline': {'downlink': 0, 'rtt': 0, 'effectiveType': 'offline'}
-        }
-        
-        profile = network_profiles[connection_type]
+        params = NETWORK_PROFILES[connection_type]
         
         try:
-            driver.execute_cdp_cmd('Network.emulateNetworkConditions', {
-                'offline': connection_type == 'offline',
-                'downloadThroughput': profile['downlink'] * 1024 * 1024 / 8,
-                'uploadThroughput': profile['downlink'] * 1024 * 1024 / 16,
-                'latency': profile['rtt']
-            })
+            driver.execute_cdp_cmd('Network.emulateNetworkConditions', params)
             logger.info(f"Network changed to: {connection_type}")
         except Exception as e:
             logger.warning(f"Could not emulate network conditions: {e}")
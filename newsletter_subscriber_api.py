@@ -8,16 +8,32 @@ import os
 import re
 import json
 import time
+import atexit
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from collections import OrderedDict
 from typing import Dict, Optional, List, Tuple
+from urllib.parse import urlsplit
 from flask import Flask, request, jsonify
 from flask_cors import CORS
-from functools import wraps
-from selenium.webdriver.common.by import By
+from functools import wraps, lru_cache
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import (
+    TimeoutException, JavascriptException, StaleElementReferenceException, WebDriverException
+)
 import random
+import numpy as np
+
+try:
+    from waitress import serve
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    serve = None
+    WAITRESS_AVAILABLE = False
 
 # Import our advanced scraper components
 from advanced_scraper_ultra import ultra_scraper
@@ -25,6 +41,8 @@ from behavioral_enhancer import behavioral_enhancer
 from ban_detector import ban_detector
 from captcha_solver import captcha_solver
 from session_manager import session_manager
+from anti_bot_engine_advanced import advanced_anti_bot_engine
+from driver_pool import DriverPool, NoDriverAvailable
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -37,6 +55,200 @@ CORS(app)
 # Configuration
 API_KEY = os.environ.get('NEWSLETTER_API_KEY', 'your-secret-api-key-here')
 TEST_EMAIL = os.environ.get('TEST_EMAIL', 'test@example.com')
+DRIVER_POOL_SIZE = int(os.environ.get('DRIVER_POOL_SIZE', '4'))
+SUBSCRIBE_TIMEOUT = int(os.environ.get('SUBSCRIBE_TIMEOUT', '120'))
+# Request threads; more than the driver pool so /health answers while every browser is busy
+SERVER_THREADS = int(os.environ.get('SERVER_THREADS', str(DRIVER_POOL_SIZE + 4)))
+FAST_TYPING = os.environ.get('FAST_TYPING', '1') == '1'
+HUMAN_SIM = os.environ.get('HUMAN_SIM', '0') == '1'
+
+# Chrome launch blueprint shared by every pooled driver
+CHROME_ARGUMENTS = (
+    '--disable-blink-features=AutomationControlled',
+    '--headless',  # Run in headless mode for API
+)
+CHROME_EXPERIMENTAL_OPTIONS = (
+    ("excludeSwitches", ["enable-automation"]),
+    ('useAutomationExtension', False),
+    # Form detection never needs images; stylesheets stay on
+    # because visibility checks depend on computed layout
+    ("prefs", {
+        "profile.managed_default_content_settings.images": 2
+    }),
+)
+
+_SCHEME_RE = re.compile(r'^https?://', re.I)
+_RNG = np.random.default_rng()
+_DOMAIN_TAG_TABLE = str.maketrans('.-', '__')
+
+
+@lru_cache(maxsize=1024)
+def _domain_tag(domain: str) -> str:
+    """Plus-addressing tag for a domain (dots and dashes become underscores)"""
+    return domain.translate(_DOMAIN_TAG_TABLE)
+
+# Sets an input's value in one call and fires the events frameworks listen for
+SET_INPUT_VALUE_SCRIPT = """
+const [el, value] = arguments;
+el.value = value;
+el.dispatchEvent(new Event('input', {bubbles: true}));
+el.dispatchEvent(new Event('change', {bubbles: true}));
+"""
+
+# Text that indicates a subscription went through, on the page or in the URL
+SUCCESS_INDICATORS = (
+    "thank you", "thanks", "success", "confirmed",
+    "subscribed", "welcome", "check your email",
+    "you're in", "you're subscribed", "almost there"
+)
+SUCCESS_URL_WORDS = ('success', 'thank', 'confirm', 'welcome')
+
+# Single alternations so each poll is one regex scan instead of N substring searches
+_SUCCESS_PATTERN = '|'.join(map(re.escape, SUCCESS_INDICATORS))
+_SUCCESS_URL_PATTERN = '|'.join(map(re.escape, SUCCESS_URL_WORDS))
+
+
+# Visible required name inputs and unchecked consent checkboxes within a form,
+# returned as [element, kind] pairs
+ADDITIONAL_FIELDS_SCRIPT = """
+const form = arguments[0];
+const out = [];
+for (const n of form.querySelectorAll('input[name*="name"], input[name*="first"], input[name*="last"]')) {
+    if (n.offsetParent !== null && n.required) out.push([n, 'name']);
+}
+for (const c of form.querySelectorAll('input[type="checkbox"][required], input[type="checkbox"][name*="consent"], input[type="checkbox"][name*="agree"]')) {
+    if (c.offsetParent !== null && !c.checked) out.push([c, 'checkbox']);
+}
+return out;
+"""
+
+# Checks body text, URL and success alerts in one pass; returns what matched or null
+CHECK_SUCCESS_SCRIPT = """
+const successRe = new RegExp(arguments[0], 'i');
+const urlRe = new RegExp(arguments[1], 'i');
+// Mid-navigation the new document may not have a body yet
+const hit = document.body ? document.body.innerText.match(successRe) : null;
+if (hit) return 'text: ' + hit[0].toLowerCase();
+if (urlRe.test(location.href)) return 'url: ' + location.href;
+const alert = document.querySelector('[role="alert"], .alert-success, .success-message, .thank-you');
+if (alert && alert.offsetParent !== null) return 'alert';
+return null;
+"""
+
+
+# Transient errors while the post-submit page is loading
+_SUCCESS_POLL_IGNORED = (JavascriptException, StaleElementReferenceException, WebDriverException)
+
+
+class _SuccessCondition:
+    """WebDriverWait condition that fires once a success indicator appears"""
+    
+    def __call__(self, driver):
+        hit = driver.execute_script(CHECK_SUCCESS_SCRIPT, _SUCCESS_PATTERN, _SUCCESS_URL_PATTERN)
+        if hit:
+            logger.info(f"Success indicator found: {hit}")
+            return True
+        return False
+
+
+# Elements matching a selector (optionally under a root) that are rendered
+VISIBLE_ELEMENTS_SCRIPT = """
+const [selector, root] = arguments;
+return Array.from((root || document).querySelectorAll(selector)).filter(
+    e => e.offsetParent !== null || getComputedStyle(e).position === 'fixed');
+"""
+
+
+def _visible_elements(driver, css_group: str, root=None) -> List:
+    """Visible elements matching css_group, filtered browser-side in one call"""
+    return driver.execute_script(VISIBLE_ELEMENTS_SCRIPT, css_group, root) or []
+
+
+def _closest(driver, element, css: str = 'div'):
+    """Nearest ancestor of element matching css, via Element.closest()"""
+    return driver.execute_script(
+        "return arguments[0].parentElement && arguments[0].parentElement.closest(arguments[1]);",
+        element, css
+    )
+
+# Returns the first CAPTCHA selector whose first match is rendered, or null
+DETECT_CAPTCHA_SCRIPT = """
+for (const sel of arguments[0]) {
+    const el = document.querySelector(sel);
+    if (el && el.offsetParent !== null) return sel;
+}
+return null;
+"""
+
+# domain -> form selector that led to a successful submission (LRU)
+_DOMAIN_SELECTOR_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_DOMAIN_SELECTOR_CACHE_SIZE = 1024
+_domain_selector_lock = threading.Lock()
+
+
+def _cached_form_selector(domain: str) -> Optional[str]:
+    """Form selector that worked for domain before, if any"""
+    with _domain_selector_lock:
+        selector = _DOMAIN_SELECTOR_CACHE.get(domain)
+        if selector is not None:
+            _DOMAIN_SELECTOR_CACHE.move_to_end(domain)
+        return selector
+
+
+def _remember_form_selector(domain: str, selector: str):
+    """Record the form selector that worked for domain"""
+    with _domain_selector_lock:
+        _DOMAIN_SELECTOR_CACHE[domain] = selector
+        _DOMAIN_SELECTOR_CACHE.move_to_end(domain)
+        if len(_DOMAIN_SELECTOR_CACHE) > _DOMAIN_SELECTOR_CACHE_SIZE:
+            _DOMAIN_SELECTOR_CACHE.popitem(last=False)
+
+# Heuristic for pages that only render some content once scrolled into view
+HAS_LAZY_CONTENT_SCRIPT = """
+return !!document.querySelector('[loading="lazy"], [data-src], [data-lazy-src]');
+"""
+
+# Async script: scroll to the footer and resolve after two animation frames
+SCROLL_TO_BOTTOM_SCRIPT = """
+const done = arguments[arguments.length - 1];
+window.scrollTo(0, document.body.scrollHeight);
+requestAnimationFrame(() => requestAnimationFrame(() => done(true)));
+"""
+
+# Returns up to three links whose text or href mentions a newsletter signup
+FIND_NEWSLETTER_LINKS_SCRIPT = """
+const re = /newsletter|subscribe|signup|join/i;
+const out = [];
+for (const a of document.querySelectorAll('a[href]')) {
+    if (re.test(a.textContent) || re.test(a.href)) {
+        out.push(a);
+        if (out.length === 3) break;
+    }
+}
+return out;
+"""
+
+# Finds the first visible newsletter form containing a visible email input and
+# a submit button, returning [form, email_input, submit_button, form_selector].
+# Runs entirely in the browser so the whole probe costs one WebDriver call.
+FIND_FORM_SCRIPT = """
+const [formGroup, emailGroup, buttonGroup, buttonWords] = arguments;
+const visible = el => el.offsetParent !== null;
+for (const form of document.querySelectorAll(formGroup)) {
+    if (!visible(form)) continue;
+    const email = Array.from(form.querySelectorAll(emailGroup)).find(visible);
+    if (!email) continue;
+    let button = Array.from(form.querySelectorAll(buttonGroup)).find(visible);
+    if (!button) {
+        button = Array.from(form.querySelectorAll('button')).find(
+            b => buttonWords.some(w => b.innerText.toLowerCase().includes(w)));
+    }
+    if (button) {
+        return [form, email, button, formGroup.split(',').find(sel => form.matches(sel))];
+    }
+}
+return null;
+"""
 
 class NewsletterSubscriber:
     """Handles newsletter subscription logic with anti-detection"""
@@ -90,71 +302,97 @@ class NewsletterSubscriber:
             ]
         }
         
+        self._email_user, self._email_host = TEST_EMAIL.split('@', 1)
+        
         self.email_patterns = {
             'standard': TEST_EMAIL,
-            'plus_addressing': f"{TEST_EMAIL.split('@')[0]}+{{tag}}@{TEST_EMAIL.split('@')[1]}",
+            'plus_addressing': f"{self._email_user}+{{tag}}@{self._email_host}",
             'subdomain': f"{{tag}}.{TEST_EMAIL}"
         }
+        
+        # Precompiled selector groups and text matchers, built once per instance
+        self._form_group = ','.join(self.common_selectors['forms'])
+        self._email_group = ','.join(self.common_selectors['email_inputs'])
+        # jQuery-style :contains() is not valid CSS; text matching covers it
+        self._button_group = ','.join(
+            s for s in self.common_selectors['submit_buttons'] if ':contains' not in s
+        )
+        self._button_words = ('subscribe', 'sign', 'join', 'submit', 'go', 'send')
+        self._submit_word_re = re.compile(r'subscribe|sign|join|submit')
+        self._captcha_selectors = (
+            'iframe[src*="recaptcha"]',
+            'iframe[src*="hcaptcha"]',
+            'div[class*="captcha"]',
+            'div[id*="captcha"]',
+            '[class*="g-recaptcha"]',
+            '[class*="h-captcha"]'
+        )
+        self._indicator_re = re.compile(
+            '|'.join(map(re.escape, self.common_selectors['newsletter_indicators']))
+        )
     
-    def find_newsletter_form(self, driver) -> Optional[Dict]:
+    def find_newsletter_form(self, driver, domain: str = None) -> Optional[Dict]:
         """
         Find newsletter signup form on the page
         Returns dict with form, email_input, and submit_button elements
         """
         logger.info("Searching for newsletter signup form...")
         
-        # Method 1: Look for obvious newsletter forms
-        for form_selector in self.common_selectors['forms']:
+        # Method 1: Look for obvious newsletter forms (single browser-side scan),
+        # trying the selector that worked last time for this domain first
+        form_groups = [self._form_group]
+        cached_selector = _cached_form_selector(domain) if domain else None
+        if cached_selector:
+            form_groups.insert(0, cached_selector)
+        
+        for form_group in form_groups:
             try:
-                forms = driver.find_elements(By.CSS_SELECTOR, form_selector)
-                for form in forms:
-                    if not form.is_displayed():
-                        continue
-                    
-                    # Look for email input within form
-                    for email_selector in self.common_selectors['email_inputs']:
-                        try:
-                            email_input = form.find_element(By.CSS_SELECTOR, email_selector)
-                            if email_input and email_input.is_displayed():
-                                # Look for submit button
-                                submit_button = self._find_submit_button(form)
-                                if submit_button:
-                                    logger.info(f"Found newsletter form with selector: {form_selector}")
-                                    return {
-                                        'form': form,
-                                        'email_input': email_input,
-                                        'submit_button': submit_button,
-                                        'method': 'form_based'
-                                    }
-                        except:
-                            continue
+                match = driver.execute_script(
+                    FIND_FORM_SCRIPT,
+                    form_group,
+                    self._email_group,
+                    self._button_group,
+                    self._button_words
+                )
+                if match:
+                    form, email_input, submit_button, form_selector = match
+                    logger.info(f"Found newsletter form with selector: {form_selector}")
+                    return {
+                        'form': form,
+                        'email_input': email_input,
+                        'submit_button': submit_button,
+                        'method': 'form_based',
+                        'selector': form_selector
+                    }
             except Exception as e:
-                logger.debug(f"Error checking form selector {form_selector}: {e}")
+                logger.debug(f"Error scanning for newsletter forms: {e}")
         
         # Method 2: Look for standalone email inputs (not in forms)
         logger.info("Looking for standalone email inputs...")
-        for email_selector in self.common_selectors['email_inputs']:
+        try:
+            email_inputs = _visible_elements(driver, self._email_group)
+        except Exception:
+            email_inputs = []
+        
+        for email_input in email_inputs:
             try:
-                email_inputs = driver.find_elements(By.CSS_SELECTOR, email_selector)
-                for email_input in email_inputs:
-                    if not email_input.is_displayed():
-                        continue
-                    
-                    # Check if there's newsletter-related text nearby
-                    parent = email_input.find_element(By.XPATH, './..')
-                    parent_text = parent.text.lower()
-                    
-                    if any(indicator in parent_text for indicator in self.common_selectors['newsletter_indicators']):
-                        # Look for nearby submit button
-                        submit_button = self._find_nearby_submit_button(driver, email_input)
-                        if submit_button:
-                            logger.info("Found standalone newsletter signup")
-                            return {
-                                'form': None,
-                                'email_input': email_input,
-                                'submit_button': submit_button,
-                                'method': 'standalone'
-                            }
+                # Check if there's newsletter-related text nearby
+                parent_text = driver.execute_script(
+                    "const p = arguments[0].parentElement; return p ? p.innerText : '';",
+                    email_input
+                ).lower()
+                
+                if self._indicator_re.search(parent_text):
+                    # Look for nearby submit button
+                    submit_button = self._find_nearby_submit_button(driver, email_input)
+                    if submit_button:
+                        logger.info("Found standalone newsletter signup")
+                        return {
+                            'form': None,
+                            'email_input': email_input,
+                            'submit_button': submit_button,
+                            'method': 'standalone'
+                        }
             except:
                 continue
         
@@ -170,7 +408,7 @@ class NewsletterSubscriber:
                 time.sleep(3)  # Wait for page/modal to load
                 
                 # Try to find form again
-                result = self.find_newsletter_form(driver)
+                result = self.find_newsletter_form(driver, domain)
                 if result:
                     return result
             except:
@@ -178,44 +416,21 @@ class NewsletterSubscriber:
         
         return None
     
-    def _find_submit_button(self, form) -> Optional[any]:
-        """Find submit button within or near a form"""
-        # Look within form first
-        for button_selector in self.common_selectors['submit_buttons']:
-            try:
-                button = form.find_element(By.CSS_SELECTOR, button_selector)
-                if button and button.is_displayed():
-                    return button
-            except:
-                continue
-        
-        # Look for button with text
-        try:
-            buttons = form.find_elements(By.TAG_NAME, 'button')
-            for button in buttons:
-                button_text = button.text.lower()
-                if any(word in button_text for word in ['subscribe', 'sign', 'join', 'submit', 'go', 'send']):
-                    return button
-        except:
-            pass
-        
-        return None
-    
     def _find_nearby_submit_button(self, driver, email_input) -> Optional[any]:
         """Find submit button near an email input"""
         try:
             # Look for button in same parent container
-            parent = email_input.find_element(By.XPATH, './ancestor::div[1]')
-            buttons = parent.find_elements(By.TAG_NAME, 'button')
-            for button in buttons:
-                if button.is_displayed():
-                    button_text = button.text.lower()
-                    if any(word in button_text for word in ['subscribe', 'sign', 'join', 'submit']):
-                        return button
+            parent = _closest(driver, email_input, 'div')
+            if parent is None:
+                return None
+            for button in _visible_elements(driver, 'button', parent):
+                button_text = button.text.lower()
+                if self._submit_word_re.search(button_text):
+                    return button
             
             # Look for input submit
-            submits = parent.find_elements(By.CSS_SELECTOR, 'input[type="submit"]')
-            if submits and submits[0].is_displayed():
+            submits = _visible_elements(driver, 'input[type="submit"]', parent)
+            if submits:
                 return submits[0]
         except:
             pass
@@ -224,34 +439,21 @@ class NewsletterSubscriber:
     
     def _find_newsletter_links(self, driver) -> List:
         """Find links that might lead to newsletter signup"""
-        newsletter_links = []
-        
         try:
-            all_links = driver.find_elements(By.TAG_NAME, 'a')
-            for link in all_links:
-                link_text = link.text.lower()
-                href = link.get_attribute('href') or ''
-                
-                if any(word in link_text + href for word in ['newsletter', 'subscribe', 'signup', 'join']):
-                    newsletter_links.append(link)
+            return driver.execute_script(FIND_NEWSLETTER_LINKS_SCRIPT) or []
         except:
-            pass
-        
-        return newsletter_links
+            return []
     
     def generate_unique_email(self, domain: str) -> str:
         """Generate a unique email address for this subscription"""
-        # Use plus addressing for tracking
-        tag = domain.replace('.', '_').replace('-', '_')
-        timestamp = str(int(time.time()))[-6:]  # Last 6 digits of timestamp
-        
         if '+' in TEST_EMAIL:
             # Already using plus addressing
             return TEST_EMAIL
-        else:
-            # Add plus addressing
-            parts = TEST_EMAIL.split('@')
-            return f"{parts[0]}+{tag}_{timestamp}@{parts[1]}"
+        
+        # Use plus addressing for tracking
+        tag = _domain_tag(domain)
+        timestamp = int(time.time()) % 1000000  # Last 6 digits of timestamp
+        return f"{self._email_user}+{tag}_{timestamp:06d}@{self._email_host}"
     
     def fill_and_submit_form(self, driver, form_elements: Dict, domain: str) -> Dict:
         """Fill out and submit the newsletter form"""
@@ -263,7 +465,8 @@ class NewsletterSubscriber:
             email = self.generate_unique_email(domain)
             
             # Use behavioral enhancer for human-like interaction
-            behavioral_enhancer.select_profile('casual_browser')
+            if HUMAN_SIM:
+                behavioral_enhancer.select_profile('casual_browser')
             
             # Scroll to element
             driver.execute_script("arguments[0].scrollIntoView(true);", email_input)
@@ -276,17 +479,21 @@ class NewsletterSubscriber:
             # Clear any existing value
             email_input.clear()
             
-            # Type email with human-like speed
-            for char in email:
-                email_input.send_keys(char)
-                time.sleep(random.uniform(0.05, 0.15))
+            # Type email (instantly, or with human-like speed)
+            if FAST_TYPING:
+                driver.execute_script(SET_INPUT_VALUE_SCRIPT, email_input, email)
+            else:
+                delays = _RNG.uniform(0.05, 0.15, size=len(email)).tolist()
+                for char, delay in zip(email, delays):
+                    email_input.send_keys(char)
+                    time.sleep(delay)
             
             # Random pause (like checking the email)
             time.sleep(random.uniform(0.5, 2))
             
             # Check for additional required fields
             if form_elements['form']:
-                self._fill_additional_fields(form_elements['form'])
+                self._fill_additional_fields(driver, form_elements['form'])
             
             # Scroll to submit button
             driver.execute_script("arguments[0].scrollIntoView(true);", submit_button)
@@ -295,10 +502,7 @@ class NewsletterSubscriber:
             # Click submit
             submit_button.click()
             
-            # Wait for response
-            time.sleep(3)
-            
-            # Check for success indicators
+            # Wait for success indicators (returns as soon as one appears)
             success = self._check_submission_success(driver)
             
             return {
@@ -314,27 +518,22 @@ class NewsletterSubscriber:
                 'error': str(e)
             }
     
-    def _fill_additional_fields(self, form):
+    def _fill_additional_fields(self, driver, form):
         """Fill any additional required fields in the form"""
         try:
-            # Check for name fields
-            name_inputs = form.find_elements(By.CSS_SELECTOR, 
-                'input[name*="name"], input[name*="first"], input[name*="last"]')
-            
-            for name_input in name_inputs:
-                if name_input.is_displayed() and name_input.get_attribute('required'):
-                    name_input.clear()
-                    name_input.send_keys("Test User")
-                    time.sleep(random.uniform(0.2, 0.5))
-            
-            # Check for checkboxes (consent, terms, etc.)
-            checkboxes = form.find_elements(By.CSS_SELECTOR, 
-                'input[type="checkbox"][required], input[type="checkbox"][name*="consent"], input[type="checkbox"][name*="agree"]')
-            
-            for checkbox in checkboxes:
-                if checkbox.is_displayed() and not checkbox.is_selected():
-                    checkbox.click()
-                    time.sleep(random.uniform(0.2, 0.5))
+            # Required name fields and unchecked consent/terms checkboxes, in one call
+            fields = driver.execute_script(ADDITIONAL_FIELDS_SCRIPT, form) or []
+            
+            for element, kind in fields:
+                if kind == 'name':
+                    if FAST_TYPING:
+                        driver.execute_script(SET_INPUT_VALUE_SCRIPT, element, "Test User")
+                    else:
+                        element.clear()
+                        element.send_keys("Test User")
+                else:
+                    element.click()
+                time.sleep(random.uniform(0.2, 0.5))
                     
         except Exception as e:
             logger.debug(f"Error filling additional fields: {e}")
@@ -342,37 +541,13 @@ class NewsletterSubscriber:
     def _check_submission_success(self, driver) -> bool:
         """Check if the form submission was successful"""
         try:
-            # Check for success messages
-            success_indicators = [
-                "thank you", "thanks", "success", "confirmed", 
-                "subscribed", "welcome", "check your email",
-                "you're in", "you're subscribed", "almost there"
-            ]
-            
-            # Get page text
-            page_text = driver.find_element(By.TAG_NAME, 'body').text.lower()
-            
-            # Check for success indicators
-            for indicator in success_indicators:
-                if indicator in page_text:
-                    logger.info(f"Success indicator found: {indicator}")
-                    return True
-            
-            # Check if we're redirected to a success page
-            current_url = driver.current_url.lower()
-            if any(word in current_url for word in ['success', 'thank', 'confirm', 'welcome']):
-                logger.info(f"Success URL detected: {current_url}")
-                return True
-            
-            # Check for success alerts/modals
-            try:
-                alerts = driver.find_elements(By.CSS_SELECTOR, 
-                    '[role="alert"], .alert-success, .success-message, .thank-you')
-                if alerts and alerts[0].is_displayed():
-                    return True
-            except:
-                pass
-            
+            # Poll page text, URL and success alerts/modals; the page is usually
+            # still navigating after submit, so keep polling through script errors
+            return WebDriverWait(
+                driver, 5, poll_frequency=0.25, ignored_exceptions=_SUCCESS_POLL_IGNORED
+            ).until(_SuccessCondition())
+        except TimeoutException:
+            pass
         except Exception as e:
             logger.error(f"Error checking success: {e}")
         
@@ -383,39 +558,21 @@ class NewsletterSubscriber:
         logger.info(f"Attempting to subscribe to newsletter on {domain}")
         
         # Ensure domain has protocol
-        if not domain.startswith('http'):
-            url = f"https://{domain}"
-        else:
-            url = domain
-            domain = url.replace('https://', '').replace('http://', '').split('/')[0]
-        
-        # Create driver with all anti-detection features
-        from selenium import webdriver
-        from selenium.webdriver.chrome.options import Options
+        url = domain if _SCHEME_RE.match(domain) else f"https://{domain}"
+        domain = urlsplit(url).hostname or domain
         
-        options = Options()
-        options.add_argument('--disable-blink-features=AutomationControlled')
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-        options.add_argument('--headless')  # Run in headless mode for API
-        
-        driver = webdriver.Chrome(options=options)
+        driver = None
         
         try:
-            # Apply anti-detection
-            from anti_bot_engine_advanced import advanced_anti_bot_engine
-            advanced_anti_bot_engine.apply_stealth_settings(driver)
+            # Check out a warm driver from the pool
+            driver = driver_pool.acquire()
             
-            # Navigate to the site
-            driver.get(url)
-            
-            # Wait for page load
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, 'body'))
-            )
+            # Navigate to the site (returns at DOMContentLoaded with the eager strategy)
+            driver_pool.navigate(driver, url)
             
             # Apply behavioral patterns
-            behavioral_enhancer.simulate_reading_pattern(driver, 1000)
+            if HUMAN_SIM:
+                behavioral_enhancer.simulate_reading_pattern(driver, 1000)
             
             # Check for CAPTCHA
             if self._detect_captcha(driver):
@@ -429,13 +586,13 @@ class NewsletterSubscriber:
                     }
             
             # Find newsletter form
-            form_elements = self.find_newsletter_form(driver)
+            form_elements = self.find_newsletter_form(driver, domain)
             
-            if not form_elements:
-                # Try scrolling to footer (newsletters often in footer)
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
-                form_elements = self.find_newsletter_form(driver)
+            # The scan already sees the whole DOM; only retry after scrolling to
+            # the footer when the page looks like it lazy-loads content
+            if not form_elements and driver.execute_script(HAS_LAZY_CONTENT_SCRIPT):
+                driver.execute_async_script(SCROLL_TO_BOTTOM_SCRIPT)
+                form_elements = self.find_newsletter_form(driver, domain)
             
             if not form_elements:
                 return {
@@ -448,6 +605,8 @@ class NewsletterSubscriber:
             result = self.fill_and_submit_form(driver, form_elements, domain)
             
             if result['success']:
+                if form_elements.get('selector'):
+                    _remember_form_selector(domain, form_elements['selector'])
                 return {
                     'success': True,
                     'message': 'Subscription form submitted successfully',
@@ -462,6 +621,14 @@ class NewsletterSubscriber:
                     'details': result.get('error')
                 }
             
+        except NoDriverAvailable as e:
+            logger.warning(str(e))
+            return {
+                'success': False,
+                'error': 'NO_BROWSER_AVAILABLE',
+                'message': str(e)
+            }
+        
         except Exception as e:
             logger.error(f"Error during subscription process: {e}")
             return {
@@ -471,33 +638,53 @@ class NewsletterSubscriber:
             }
         
         finally:
+            if driver is not None:
+                driver_pool.release(driver)
+    
+    def create_driver(self):
+        """Create a driver with all anti-detection features"""
+        options = Options()
+        for argument in CHROME_ARGUMENTS:
+            options.add_argument(argument)
+        for name, value in CHROME_EXPERIMENTAL_OPTIONS:
+            options.add_experimental_option(name, value)
+        # Return from driver.get() at DOMContentLoaded rather than full load
+        options.page_load_strategy = 'eager'
+        
+        driver = webdriver.Chrome(options=options)
+        driver.set_script_timeout(5)
+        
+        try:
+            # Apply anti-detection
+            advanced_anti_bot_engine.apply_stealth_settings(driver)
+        except Exception:
             driver.quit()
+            raise
+        
+        return driver
     
     def _detect_captcha(self, driver) -> bool:
         """Detect if there's a CAPTCHA on the page"""
-        captcha_indicators = [
-            'iframe[src*="recaptcha"]',
-            'iframe[src*="hcaptcha"]',
-            'div[class*="captcha"]',
-            'div[id*="captcha"]',
-            '[class*="g-recaptcha"]',
-            '[class*="h-captcha"]'
-        ]
-        
-        for selector in captcha_indicators:
-            try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements and elements[0].is_displayed():
-                    logger.info(f"CAPTCHA detected: {selector}")
-                    return True
-            except:
-                continue
+        try:
+            hit = driver.execute_script(DETECT_CAPTCHA_SCRIPT, self._captcha_selectors)
+            if hit:
+                logger.info(f"CAPTCHA detected: {hit}")
+                return True
+        except Exception as e:
+            logger.debug(f"Error checking for CAPTCHA: {e}")
         
         return False
 
 # Initialize subscriber
 newsletter_subscriber = NewsletterSubscriber()
 
+# Shared pool of warm drivers, shut down with the process
+driver_pool = DriverPool(newsletter_subscriber.create_driver, DRIVER_POOL_SIZE)
+atexit.register(driver_pool.close)
+
+# Subscriptions run on a worker per pooled driver so requests don't queue behind each other
+subscription_executor = ThreadPoolExecutor(max_workers=DRIVER_POOL_SIZE)
+
 # Authentication decorator
 def require_api_key(f):
     @wraps(f)
@@ -555,7 +742,16 @@ def subscribe():
     domain = domain.strip().lower()
     
     # Attempt subscription
-    result = newsletter_subscriber.subscribe_to_newsletter(domain)
+    future = subscription_executor.submit(newsletter_subscriber.subscribe_to_newsletter, domain)
+    try:
+        result = future.result(timeout=SUBSCRIBE_TIMEOUT)
+    except FutureTimeoutError:
+        return jsonify({
+            'status': 'error',
+            'message': f'Subscription did not finish within {SUBSCRIBE_TIMEOUT} seconds',
+            'domain': domain,
+            'error_code': 'TIMEOUT'
+        }), 504
     
     # Format response based on result
     if result['success']:
@@ -578,6 +774,8 @@ def subscribe():
             http_status = 422
         elif error_code == 'SUBMISSION_FAILED':
             http_status = 422
+        elif error_code == 'NO_BROWSER_AVAILABLE':
+            http_status = 503
         else:
             http_status = 500
         
@@ -630,9 +828,26 @@ def index():
                 'method': 'GET',
                 'description': 'Health check endpoint'
             }
+        },
+        'configuration': {
+            'HUMAN_SIM': 'Set to 1 to simulate human reading behaviour before searching; '
+                         'more realistic but adds several seconds per request',
+            'FAST_TYPING': 'Set to 0 to type the email one key at a time'
         }
     }), 200
 
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5001))
-    app.run(host='0.0.0.0', port=port, debug=True)
\ No newline at end of file
+    
+    # Single process on purpose: the driver pool lives in this process, so
+    # scale with threads rather than workers
+    try:
+        driver_pool.prewarm()
+    except Exception as e:
+        logger.warning(f"Could not prewarm driver pool: {e}")
+    
+    if WAITRESS_AVAILABLE:
+        serve(app, host='0.0.0.0', port=port, threads=SERVER_THREADS)
+    else:
+        logger.warning("waitress not installed, falling back to the Flask development server")
+        app.run(host='0.0.0.0', port=port, threaded=True)
\ No newline at end of file
@@ -0,0 +1,27 @@
+"""
+Gunicorn configuration for the Property Owner Lookup API
+Lookups are network-bound, so each worker runs a thread pool (gthread)
+"""
+
+import os
+import multiprocessing
+
+bind = f"0.0.0.0:{os.environ.get('PROPERTY_PORT', 5002)}"
+workers = int(os.environ.get('PROPERTY_GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+worker_class = "gthread"
+threads = int(os.environ.get('PROPERTY_GUNICORN_THREADS', 8))
+timeout = 120  # batch requests may drive browsers for a while
+keepalive = 30
+max_requests = 1000
+max_requests_jitter = 50
+loglevel = "info"
+
+
+def on_starting(server):
+    """Validate the environment and create the schema once, before workers fork"""
+    # Without a shared key every worker would invent its own random one
+    if not os.environ.get('PROPERTY_API_KEY'):
+        raise RuntimeError("PROPERTY_API_KEY is not set; add it to the service environment")
+    
+    from property_owner_api import init_database
+    init_database()
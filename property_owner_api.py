@@ -8,29 +8,65 @@ Optimized for scale with caching, batch processing, and county-specific strategi
 import os
 import re
 import json
+import asyncio
 import time
 import hashlib
 import logging
+import threading
 from typing import Dict, List, Optional, Tuple
+from collections import defaultdict, OrderedDict
+from urllib.parse import urlsplit
 from datetime import datetime, timedelta
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 from functools import wraps, lru_cache
 import redis
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import aiohttp
 from bs4 import BeautifulSoup
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import pandas as pd
-from dataclasses import dataclass, asdict
+from psycopg2.extras import execute_values
+from dataclasses import dataclass, asdict, astuple
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    HTMLParser = None
+    SELECTOLAX_AVAILABLE = False
 
 # Import our scraper components
 from advanced_scraper_ultra import ultra_scraper
 from smart_proxy_manager import smart_proxy_manager
 from captcha_solver import captcha_solver
-from database_manager import db_manager
+from database_manager import database_manager as db_manager
+from property_patterns import (
+    EXTRACTION_PATTERNS, MAX_EXTRACT_CHARS, HYPERSCAN_AVAILABLE, hyperscan,
+    build_hyperscan_database, clean_text, extract_fields
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -46,7 +82,7 @@ try:
         host=os.environ.get('REDIS_HOST', 'localhost'),
         port=int(os.environ.get('REDIS_PORT', 6379)),
         db=0,
-        decode_responses=True
+        decode_responses=False  # cache values are handed to the JSON decoder as bytes
     )
     redis_client.ping()
     CACHE_ENABLED = True
@@ -55,10 +91,67 @@ except:
     CACHE_ENABLED = False
     redis_client = None
 
+def cache_dumps(info: 'PropertyInfo') -> bytes:
+    """
+    Serialize a PropertyInfo cache entry.
+    
+    With msgpack the entry is the field tuple in declaration order, otherwise
+    a JSON object (encoded with orjson when installed).
+    """
+    if MSGPACK_AVAILABLE:
+        return msgpack.packb(astuple(info))
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(asdict(info))
+    return json.dumps(asdict(info)).encode()
+
+def cache_loads(raw: bytes) -> Optional['PropertyInfo']:
+    """Deserialize a cache entry written by cache_dumps, None if unreadable"""
+    try:
+        if MSGPACK_AVAILABLE:
+            return PropertyInfo(*msgpack.unpackb(raw))
+        if ORJSON_AVAILABLE:
+            return PropertyInfo(**orjson.loads(raw))
+        return PropertyInfo(**json.loads(raw))
+    except Exception as e:
+        # Entries written in another format are treated as misses
+        logger.debug(f"Unreadable cache entry: {e}")
+        return None
+
+# Whitespace runs collapsed in extracted values
+_WS_RE = re.compile(r'\s+')
+
+def bounded_text(chunks, limit: int = MAX_EXTRACT_CHARS, separator: str = '') -> str:
+    """Join text chunks, stopping once limit characters have been collected"""
+    parts = []
+    size = 0
+    for chunk in chunks:
+        parts.append(chunk)
+        size += len(chunk) + len(separator)
+        if size >= limit:
+            break
+    return separator.join(parts)[:limit]
+
+# Numeric cleanup for extracted values
+_NON_NUMERIC_RE = re.compile(r'[^\d.]')
+
+# Table row labels extract_from_row knows how to handle
+_TABLE_LABEL_RE = re.compile(r'owner|parcel|apn|value|address', re.IGNORECASE)
+
+# In-process cache in front of Redis
+L1_CACHE_SIZE = 10_000
+L1_CACHE_TTL = 3600
+
+# Worker threads for batch lookups; assessor lookups are network-bound
+PROPERTY_WORKERS = int(os.environ.get('PROPERTY_WORKERS', min(32, (os.cpu_count() or 1) * 4)))
+
+# Async batch fan-out limits for requests-strategy counties
+ASYNC_MAX_CONNECTIONS = 50
+ASYNC_PER_HOST = 4
+
 # API Configuration
 PROPERTY_API_KEY = os.environ.get('PROPERTY_API_KEY', 'property-lookup-key-' + os.urandom(16).hex())
 
-@dataclass
+@dataclass(slots=True)
 class PropertyInfo:
     """Property information data structure"""
     owner_name: Optional[str] = None
@@ -86,6 +179,33 @@ class PropertyInfo:
         if self.co_owners is None:
             self.co_owners = []
 
+class TTLCache:
+    """Thread-safe in-process LRU with per-entry expiry"""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return entry[0]
+    
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
 class CountyStrategy:
     """Base class for county-specific scraping strategies"""
     
@@ -103,6 +223,9 @@ class PropertyOwnerExtractor:
     """Main property owner extraction engine"""
     
     # County database with URLs and strategies
+    # Entries may add "selectors": {field: css selector} for pages with a known
+    # layout; parse_property_html then reads those fields directly and only
+    # falls back to the generic pattern scan when no owner is found.
     COUNTY_CONFIGS = {
         "los_angeles_ca": {
             "name": "Los Angeles County",
@@ -146,103 +269,138 @@ class PropertyOwnerExtractor:
         }
     }
     
-    # Common patterns for extracting property data
-    EXTRACTION_PATTERNS = {
-        "owner": [
-            r"Owner(?:\s+Name)?[:\s]+([^\n]+)",
-            r"Property\s+Owner[:\s]+([^\n]+)",
-            r"Deed\s+Holder[:\s]+([^\n]+)",
-            r"Name[:\s]+([^\n]+)",
-            r"Current\s+Owner[:\s]+([^\n]+)",
-            r"Taxpayer[:\s]+([^\n]+)",
-            r"Grantee[:\s]+([^\n]+)"
-        ],
-        "parcel": [
-            r"(?:Parcel|APN|PIN|Account)(?:\s+(?:Number|ID|#))?[:\s]+([A-Z0-9\-]+)",
-            r"Tax\s+ID[:\s]+([A-Z0-9\-]+)",
-            r"Folio(?:\s+Number)?[:\s]+([0-9\-]+)",
-            r"Property\s+ID[:\s]+([A-Z0-9\-]+)"
-        ],
-        "address": [
-            r"(?:Property|Site|Situs)\s+Address[:\s]+([^\n]+)",
-            r"Location[:\s]+([^\n]+)",
-            r"Physical\s+Address[:\s]+([^\n]+)"
-        ],
-        "mailing": [
-            r"(?:Mailing|Owner)\s+Address[:\s]+([^\n]+)",
-            r"Tax\s+Bill\s+Address[:\s]+([^\n]+)",
-            r"Correspondence\s+Address[:\s]+([^\n]+)"
-        ],
-        "value": [
-            r"(?:Assessed|Total)\s+Value[:\s]+\$?([0-9,]+)",
-            r"Market\s+Value[:\s]+\$?([0-9,]+)",
-            r"Taxable\s+Value[:\s]+\$?([0-9,]+)",
-            r"Fair\s+Market\s+Value[:\s]+\$?([0-9,]+)"
-        ]
-    }
+    # Common patterns for extracting property data, see property_patterns.py
+    EXTRACTION_PATTERNS = EXTRACTION_PATTERNS
+    
+    # Optional Hyperscan prefilter that finds which patterns occur in one SIMD pass
+    _HS_DATABASE, _HS_NAMES = (
+        build_hyperscan_database(EXTRACTION_PATTERNS) if HYPERSCAN_AVAILABLE else (None, [])
+    )
+    _hs_local = threading.local()
     
     def __init__(self):
-        self.executor = ThreadPoolExecutor(max_workers=5)
+        self.executor = ThreadPoolExecutor(max_workers=PROPERTY_WORKERS)
+        self._l1 = TTLCache(L1_CACHE_SIZE, L1_CACHE_TTL)
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
         
+        # Keep-alive pool sized for every worker, with backoff on gateway errors
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=max(32, PROPERTY_WORKERS),
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
     def get_cache_key(self, address: str, county: str = None) -> str:
         """Generate cache key for property lookup"""
         data = f"{address}:{county}" if county else address
-        return f"property:{hashlib.md5(data.encode()).hexdigest()}"
+        return f"property:{hashlib.blake2b(data.encode(), digest_size=16).hexdigest()}"
     
     def get_from_cache(self, address: str, county: str = None) -> Optional[PropertyInfo]:
         """Get property info from cache"""
-        if not CACHE_ENABLED:
-            return None
-            
         cache_key = self.get_cache_key(address, county)
-        cached = redis_client.get(cache_key)
         
-        if cached:
+        # L1: this process, no network
+        info = self._l1.get(cache_key)
+        if info or not CACHE_ENABLED:
+            return info
+        
+        # L2: Redis
+        cached = redis_client.get(cache_key)
+        info = cache_loads(cached) if cached else None
+        if info:
             logger.info(f"Cache hit for {address}")
-            data = json.loads(cached)
-            return PropertyInfo(**data)
-        return None
+            self._l1.set(cache_key, info)
+        return info
     
     def save_to_cache(self, address: str, info: PropertyInfo, county: str = None):
         """Save property info to cache"""
+        cache_key = self.get_cache_key(address, county)
+        self._l1.set(cache_key, info)
         if not CACHE_ENABLED:
             return
-            
-        cache_key = self.get_cache_key(address, county)
+        
         redis_client.setex(
             cache_key,
             86400,  # 24 hours
-            json.dumps(asdict(info))
+            cache_dumps(info)
         )
     
+    def batch_get_from_cache(self, addresses: List[str], county: str = None) -> Dict[str, PropertyInfo]:
+        """Get cached property info for many addresses in one MGET round trip"""
+        hits = {}
+        remote = []
+        for address in addresses:
+            cache_key = self.get_cache_key(address, county)
+            info = self._l1.get(cache_key)
+            if info:
+                hits[address] = info
+            else:
+                remote.append((address, cache_key))
+        
+        # Only L1 misses go to Redis
+        if CACHE_ENABLED and remote:
+            cached_vals = redis_client.mget([cache_key for _, cache_key in remote])
+            for (address, cache_key), cached in zip(remote, cached_vals):
+                info = cache_loads(cached) if cached else None
+                if info:
+                    hits[address] = info
+                    self._l1.set(cache_key, info)
+        
+        if hits:
+            logger.info(f"Cache hits for {len(hits)}/{len(addresses)} addresses")
+        return hits
+    
+    def batch_save_to_cache(self, pairs: List[Tuple[str, PropertyInfo]], county: str = None):
+        """Save many property infos to cache in one pipelined round trip"""
+        keyed = [(self.get_cache_key(address, county), info) for address, info in pairs]
+        for cache_key, info in keyed:
+            self._l1.set(cache_key, info)
+        if not CACHE_ENABLED or not keyed:
+            return
+        
+        # No MULTI/EXEC needed, the writes are independent
+        pipe = redis_client.pipeline(transaction=False)
+        for cache_key, info in keyed:
+            pipe.setex(
+                cache_key,
+                86400,  # 24 hours
+                cache_dumps(info)
+            )
+        pipe.execute()
+    
     def extract_with_patterns(self, text: str) -> Dict:
         """Extract property data using regex patterns"""
-        results = {}
+        # Clean text, bounded so oversized pages can't blow up the scan
+        text = clean_text(text)
         
-        # Clean text
-        text = re.sub(r'\s+', ' ', text)
-        
-        for field, patterns in self.EXTRACTION_PATTERNS.items():
-            for pattern in patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    value = match.group(1).strip()
-                    # Clean up value
-                    value = re.sub(r'\s+', ' ', value)
-                    value = value.strip(' ,.')
-                    
-                    if field == "value" and value:
-                        # Convert to float
-                        value = float(value.replace(',', ''))
-                    
-                    results[field] = value
-                    break
+        # With Hyperscan, only try the patterns that actually occur in the text
+        present = None
+        if self._HS_DATABASE is not None:
+            present = self._hyperscan_prefilter(text)
+            if not present:
+                return {}
         
-        return results
+        return extract_fields(text, present)
+    
+    def _hyperscan_prefilter(self, text: str) -> frozenset:
+        """Group names of the extraction patterns that match somewhere in text"""
+        scratch = getattr(self._hs_local, 'scratch', None)
+        if scratch is None:
+            # Scratch space is not thread-safe; keep one per worker thread
+            scratch = self._hs_local.scratch = hyperscan.Scratch(self._HS_DATABASE)
+        
+        matched = set()
+        
+        def on_match(pattern_id, start, end, flags, context):
+            matched.add(self._HS_NAMES[pattern_id])
+        
+        self._HS_DATABASE.scan(text.encode('utf-8'), match_event_handler=on_match, scratch=scratch)
+        return frozenset(matched)
     
     def search_generic(self, address: str, county_config: Dict) -> Optional[PropertyInfo]:
         """Generic search using our ultra scraper"""
@@ -262,60 +420,103 @@ class PropertyOwnerExtractor:
             )
             
             if result['success']:
-                html = result.get('data', '')
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                # Extract text and look for patterns
-                text = soup.get_text()
-                extracted = self.extract_with_patterns(text)
-                
-                # Also try to extract from tables
-                tables = soup.find_all('table')
-                for table in tables:
-                    self.extract_from_table(table, extracted)
-                
-                # Create PropertyInfo object
-                info = PropertyInfo(
-                    owner_name=extracted.get('owner'),
-                    property_address=address,
-                    mailing_address=extracted.get('mailing'),
-                    parcel_id=extracted.get('parcel'),
-                    assessed_value=extracted.get('value'),
-                    source_url=county_config['assessor_url'],
-                    confidence_score=self.calculate_confidence(extracted)
-                )
-                
-                return info
+                return self.parse_property_html(result.get('data', ''), address, county_config)
                 
         except Exception as e:
             logger.error(f"Error searching {county_config['name']}: {e}")
             return None
     
+    def parse_property_html(self, html: str, address: str, county_config: Dict) -> PropertyInfo:
+        """Build PropertyInfo from an assessor results page"""
+        tree = HTMLParser(html) if SELECTOLAX_AVAILABLE else BeautifulSoup(html, 'html.parser')
+        
+        # Counties with known page layouts read fields straight from their selectors
+        extracted = {}
+        if county_config.get('selectors'):
+            extracted = selector_extractor(tuple(county_config['selectors'].items()))(tree)
+        
+        if not extracted.get('owner'):
+            extracted.update(
+                (k, v) for k, v in self.extract_from_page(tree).items() if k not in extracted
+            )
+        
+        # Create PropertyInfo object
+        return PropertyInfo(
+            owner_name=extracted.get('owner'),
+            property_address=address,
+            mailing_address=extracted.get('mailing'),
+            parcel_id=extracted.get('parcel'),
+            assessed_value=extracted.get('value'),
+            source_url=county_config['assessor_url'],
+            confidence_score=self.calculate_confidence(extracted)
+        )
+    
+    def extract_from_page(self, tree) -> Dict:
+        """Generic extraction: regex patterns over page text, then labeled table rows"""
+        if SELECTOLAX_AVAILABLE:
+            # C-backed parser: stream text nodes, CSS queries for table rows
+            root = tree.body or tree.root
+            text = bounded_text((
+                node.text_content
+                for node in root.traverse(include_text=True)
+                if node.tag == '-text'
+            ), separator=' ') if root else ''
+            extracted = self.extract_with_patterns(text)
+            
+            for row in tree.css('table tr'):
+                cells = row.css('td, th')
+                if len(cells) >= 2:
+                    label = cells[0].text().strip()
+                    if _TABLE_LABEL_RE.search(label):
+                        self.extract_from_row(label, cells[1].text().strip(), extracted)
+        else:
+            # Extract text and look for patterns, reading strings lazily up to the scan limit
+            text = bounded_text(tree.strings)
+            extracted = self.extract_with_patterns(text)
+            
+            # Also try to extract from tables, one query over all their rows
+            self.extract_from_rows(tree.select('table tr'), extracted)
+        
+        return extracted
+    
+    async def _fetch(self, session: aiohttp.ClientSession, url: str, data: Dict) -> str:
+        """POST a search form to an assessor site and return the response body"""
+        async with session.post(url, data=data) as response:
+            response.raise_for_status()
+            return await response.text()
+    
     def extract_from_table(self, table, results: Dict):
         """Extract property data from HTML tables"""
-        rows = table.find_all('tr')
+        self.extract_from_rows(table.find_all('tr'), results)
+    
+    def extract_from_rows(self, rows, results: Dict):
+        """Extract property data from BeautifulSoup table rows with a known label"""
         for row in rows:
             cells = row.find_all(['td', 'th'])
             if len(cells) >= 2:
                 label = cells[0].get_text().strip()
-                value = cells[1].get_text().strip()
-                
-                # Check if label matches our patterns
-                label_lower = label.lower()
-                if 'owner' in label_lower and 'owner' not in results:
-                    results['owner'] = value
-                elif 'parcel' in label_lower or 'apn' in label_lower:
-                    results['parcel'] = value
-                elif 'value' in label_lower and 'value' not in results:
-                    try:
-                        results['value'] = float(re.sub(r'[^\d.]', '', value))
-                    except:
-                        pass
-                elif 'address' in label_lower:
-                    if 'mailing' in label_lower:
-                        results['mailing'] = value
-                    else:
-                        results['address'] = value
+                # Skip rows without a label of interest before touching the value cell
+                if _TABLE_LABEL_RE.search(label):
+                    self.extract_from_row(label, cells[1].get_text().strip(), results)
+    
+    def extract_from_row(self, label: str, value: str, results: Dict):
+        """Extract property data from a label/value table row"""
+        # Check if label matches our patterns
+        label_lower = label.lower()
+        if 'owner' in label_lower and 'owner' not in results:
+            results['owner'] = value
+        elif 'parcel' in label_lower or 'apn' in label_lower:
+            results['parcel'] = value
+        elif 'value' in label_lower and 'value' not in results:
+            try:
+                results['value'] = float(_NON_NUMERIC_RE.sub('', value))
+            except:
+                pass
+        elif 'address' in label_lower:
+            if 'mailing' in label_lower:
+                results['mailing'] = value
+            else:
+                results['address'] = value
     
     def calculate_confidence(self, extracted: Dict) -> float:
         """Calculate confidence score based on extracted data"""
@@ -343,6 +544,45 @@ class PropertyOwnerExtractor:
         if cached:
             return cached
         
+        info = self._lookup(address, county, state)
+        
+        if info:
+            # Save to cache under the same key it is read from
+            self.save_to_cache(address, info, county)
+            
+            # Save to database for analytics
+            self.save_to_database(info)
+        
+        return info
+    
+    def _lookup(self, address: str, county: str = None,
+                state: str = None) -> Optional[PropertyInfo]:
+        """Resolve the county and scrape the property, bypassing cache and database"""
+        return self.search_generic(address, self.resolve_county_config(address, county, state))
+    
+    async def _lookup_async(self, session: aiohttp.ClientSession, semaphores: Dict,
+                            address: str, county: str = None,
+                            state: str = None) -> Optional[PropertyInfo]:
+        """Async _lookup: plain HTTP for requests-strategy counties, browser on the pool"""
+        county_config = self.resolve_county_config(address, county, state)
+        
+        if county_config['strategy'] != 'requests':
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, self.search_generic, address, county_config)
+        
+        url = county_config['assessor_url']
+        try:
+            # Bound concurrent requests per assessor domain
+            async with semaphores[urlsplit(url).netloc]:
+                html = await self._fetch(session, url, {'address': address})
+            return self.parse_property_html(html, address, county_config)
+        except Exception as e:
+            logger.error(f"Error searching {county_config['name']}: {e}")
+            return None
+    
+    def resolve_county_config(self, address: str, county: str = None,
+                              state: str = None) -> Dict:
+        """County configuration for an address, falling back to a generic one"""
         # Determine county if not provided
         if not county:
             county = self.detect_county(address, state)
@@ -355,29 +595,11 @@ class PropertyOwnerExtractor:
             # Try generic search with common government domains
             county_config = self.build_generic_config(county, state)
         
-        # Search for property
-        info = self.search_generic(address, county_config)
-        
-        if info:
-            # Save to cache
-            self.save_to_cache(address, info, county)
-            
-            # Save to database for analytics
-            self.save_to_database(info)
-        
-        return info
+        return county_config
     
     def detect_county(self, address: str, state: str = None) -> Optional[str]:
         """Detect county from address using geocoding or patterns"""
-        # Simple pattern matching for now
-        address_lower = address.lower()
-        
-        for county_key, config in self.COUNTY_CONFIGS.items():
-            county_name = config['name'].lower()
-            if county_name.replace(' county', '') in address_lower:
-                return config['name']
-        
-        return None
+        return _detect_county_cached(address.lower())
     
     def build_generic_config(self, county: str, state: str) -> Dict:
         """Build generic configuration for unknown counties"""
@@ -422,41 +644,222 @@ class PropertyOwnerExtractor:
         except Exception as e:
             logger.error(f"Database save error: {e}")
     
+    def save_many_to_database(self, infos: List[PropertyInfo]):
+        """Save property infos to database in one multi-row INSERT"""
+        # ON CONFLICT can't touch the same row twice in one statement; last one wins
+        rows = list({
+            info.property_address: (
+                info.property_address,
+                info.owner_name,
+                info.parcel_id,
+                info.assessed_value,
+                info.lookup_date,
+                info.confidence_score
+            )
+            for info in infos
+        }.values())
+        if not rows or not db_manager:
+            return
+        if not db_manager.connection:
+            if not db_manager.connect():
+                return
+        
+        try:
+            query = """
+            INSERT INTO property_lookups 
+            (address, owner_name, parcel_id, assessed_value, lookup_date, confidence_score)
+            VALUES %s
+            ON CONFLICT (address) DO UPDATE SET
+                owner_name = EXCLUDED.owner_name,
+                assessed_value = EXCLUDED.assessed_value,
+                lookup_date = EXCLUDED.lookup_date
+            """
+            with db_manager.connection.cursor() as cursor:
+                execute_values(cursor, query, rows, page_size=500)
+            db_manager.connection.commit()
+        except Exception as e:
+            logger.error(f"Database batch save error: {e}")
+            db_manager.connection.rollback()
+    
     def batch_search(self, addresses: List[str], county: str = None, 
                     state: str = None) -> List[PropertyInfo]:
         """Search multiple addresses in parallel"""
-        results = []
+        # Serve cache hits from a single MGET; only misses go to the workers
+        hits = self.batch_get_from_cache(addresses, county)
+        results = [hits[addr] for addr in addresses if addr in hits]
+        misses = [addr for addr in addresses if addr not in hits]
+        found = []
         
-        with self.executor as executor:
-            futures = {
-                executor.submit(self.search_by_address, addr, county, state): addr 
-                for addr in addresses
-            }
-            
-            for future in as_completed(futures):
-                address = futures[future]
-                try:
-                    info = future.result(timeout=30)
-                    if info:
-                        results.append(info)
-                    else:
-                        # Return empty result for failed lookups
-                        results.append(PropertyInfo(
-                            property_address=address,
-                            confidence_score=0.0
-                        ))
-                except Exception as e:
-                    logger.error(f"Error processing {address}: {e}")
+        # The pool is shared across requests, so it must not be shut down here
+        futures = {
+            self.executor.submit(self._lookup, addr, county, state): addr 
+            for addr in misses
+        }
+        
+        for future in as_completed(futures):
+            address = futures[future]
+            try:
+                info = future.result(timeout=30)
+                if info:
+                    results.append(info)
+                    found.append((address, info))
+                else:
+                    # Return empty result for failed lookups
                     results.append(PropertyInfo(
                         property_address=address,
                         confidence_score=0.0
                     ))
+            except Exception as e:
+                logger.error(f"Error processing {address}: {e}")
+                results.append(PropertyInfo(
+                    property_address=address,
+                    confidence_score=0.0
+                ))
+        
+        self.batch_save_to_cache(found, county)
+        self.save_many_to_database([info for _, info in found])
+        
+        return results
+    
+    async def batch_search_async(self, addresses: List[str], county: str = None,
+                                 state: str = None) -> List[PropertyInfo]:
+        """Search multiple addresses on one event loop"""
+        hits = self.batch_get_from_cache(addresses, county)
+        results = [hits[addr] for addr in addresses if addr in hits]
+        misses = [addr for addr in addresses if addr not in hits]
+        
+        semaphores = defaultdict(lambda: asyncio.Semaphore(ASYNC_PER_HOST))
+        connector = aiohttp.TCPConnector(limit=ASYNC_MAX_CONNECTIONS, limit_per_host=ASYNC_PER_HOST)
+        async with aiohttp.ClientSession(
+            connector=connector,
+            headers=dict(self.session.headers),
+            timeout=aiohttp.ClientTimeout(total=30)
+        ) as session:
+            lookups = await asyncio.gather(
+                *[self._lookup_async(session, semaphores, addr, county, state) for addr in misses],
+                return_exceptions=True
+            )
+        
+        found = []
+        for address, info in zip(misses, lookups):
+            if isinstance(info, PropertyInfo):
+                results.append(info)
+                found.append((address, info))
+            else:
+                if isinstance(info, Exception):
+                    logger.error(f"Error processing {address}: {info}")
+                results.append(PropertyInfo(
+                    property_address=address,
+                    confidence_score=0.0
+                ))
         
+        self.batch_save_to_cache(found, county)
+        self.save_many_to_database([info for _, info in found])
+        
+        return results
+
+@lru_cache(maxsize=64)
+def selector_extractor(selectors: Tuple[Tuple[str, str], ...]):
+    """
+    Build an extractor for a county's ((field, css selector), ...) layout.
+    
+    The returned function takes a parsed page (selectolax or BeautifulSoup,
+    whichever parse_property_html used) and returns the fields it found.
+    """
+    if SELECTOLAX_AVAILABLE:
+        def select_text(tree, selector):
+            node = tree.css_first(selector)
+            return node.text() if node else None
+    else:
+        def select_text(tree, selector):
+            node = tree.select_one(selector)
+            return node.get_text() if node else None
+    
+    def extract(tree) -> Dict:
+        results = {}
+        for field, selector in selectors:
+            value = select_text(tree, selector)
+            value = _WS_RE.sub(' ', value).strip(' ,.') if value else None
+            if not value:
+                continue
+            
+            if field == 'value':
+                try:
+                    value = float(_NON_NUMERIC_RE.sub('', value))
+                except ValueError:
+                    continue
+            results[field] = value
         return results
+    
+    return extract
+
+# (county name, lowercase needle without " county") for detect_county
+_COUNTY_NEEDLES = [
+    (config['name'], config['name'].lower().replace(' county', ''))
+    for config in PropertyOwnerExtractor.COUNTY_CONFIGS.values()
+]
+
+def build_county_automaton(needles: List[Tuple[str, str]]):
+    """Aho-Corasick automaton over county needles, matching all names in one pass"""
+    automaton = ahocorasick.Automaton()
+    for name, needle in needles:
+        automaton.add_word(needle, name)
+    automaton.make_automaton()
+    return automaton
+
+_COUNTY_AUTOMATON = build_county_automaton(_COUNTY_NEEDLES) if AHOCORASICK_AVAILABLE else None
+
+@lru_cache(maxsize=10_000)
+def _detect_county_cached(address_lower: str) -> Optional[str]:
+    """Simple pattern matching of county names, memoized per address"""
+    if _COUNTY_AUTOMATON is not None:
+        # First county name that ends earliest in the address
+        for _, name in _COUNTY_AUTOMATON.iter(address_lower):
+            return name
+        return None
+    
+    for name, needle in _COUNTY_NEEDLES:
+        if needle in address_lower:
+            return name
+    return None
 
 # Initialize extractor
 property_extractor = PropertyOwnerExtractor()
 
+# (value, expiry) per cached helper, see ttl_cache
+_TTL_CACHE = {}
+_TTL_CACHE_LOCK = threading.Lock()
+
+def ttl_cache(ttl: float):
+    """Cache a no-argument function's result for ttl seconds"""
+    def decorator(f):
+        @wraps(f)
+        def wrapper():
+            now = time.monotonic()
+            entry = _TTL_CACHE.get(f.__name__)
+            if entry and entry[1] > now:
+                return entry[0]
+            
+            value = f()
+            with _TTL_CACHE_LOCK:
+                _TTL_CACHE[f.__name__] = (value, now + ttl)
+            return value
+        return wrapper
+    return decorator
+
+@ttl_cache(ttl=5)
+def get_cache_stats() -> Dict:
+    """Redis keyspace hit/miss counters, refreshed at most every 5 seconds"""
+    info = redis_client.info('stats')
+    
+    hits = info.get('keyspace_hits', 0)
+    misses = info.get('keyspace_misses', 0)
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': round(hits / max(1, hits + misses) * 100, 2)
+    }
+
 # Authentication decorator
 def require_api_key(f):
     @wraps(f)
@@ -481,6 +884,22 @@ def require_api_key(f):
     
     return decorated_function
 
+def batch_response(addresses: List[str], results: List[PropertyInfo]):
+    """JSON response for a batch lookup, built from one columnar frame"""
+    # object dtype keeps missing values as None instead of NaN
+    df = pd.DataFrame(
+        [astuple(r) for r in results],
+        columns=list(PropertyInfo.__dataclass_fields__),
+        dtype=object
+    )
+    
+    return jsonify({
+        'success': True,
+        'total': len(addresses),
+        'found': int(df['owner_name'].notna().sum()),
+        'data': df.to_dict(orient='records')
+    }), 200
+
 # API Routes
 @app.route('/api/property/search', methods=['POST'])
 @require_api_key
@@ -535,12 +954,31 @@ def batch_search():
     # Search for properties
     results = property_extractor.batch_search(addresses, county, state)
     
-    return jsonify({
-        'success': True,
-        'total': len(addresses),
-        'found': sum(1 for r in results if r.owner_name),
-        'data': [asdict(r) for r in results]
-    }), 200
+    return batch_response(addresses, results)
+
+@app.route('/api/property/batch_async', methods=['POST'])
+@require_api_key
+def batch_search_async():
+    """Search for multiple properties with async HTTP fan-out"""
+    data = request.get_json()
+    
+    if not data or 'addresses' not in data:
+        return jsonify({'error': 'Addresses array is required'}), 400
+    
+    addresses = data['addresses']
+    if not isinstance(addresses, list) or len(addresses) == 0:
+        return jsonify({'error': 'Addresses must be a non-empty array'}), 400
+    
+    if len(addresses) > 100:
+        return jsonify({'error': 'Maximum 100 addresses per batch'}), 400
+    
+    county = data.get('county')
+    state = data.get('state')
+    
+    # Each request gets its own event loop; browser lookups still use the thread pool
+    results = asyncio.run(property_extractor.batch_search_async(addresses, county, state))
+    
+    return batch_response(addresses, results)
 
 @app.route('/api/property/counties', methods=['GET'])
 def list_counties():
@@ -589,13 +1027,7 @@ def get_stats():
         # Get cache stats
         cache_stats = {}
         if CACHE_ENABLED:
-            info = redis_client.info('stats')
-            cache_stats = {
-                'hits': info.get('keyspace_hits', 0),
-                'misses': info.get('keyspace_misses', 0),
-                'hit_rate': round(info.get('keyspace_hits', 0) / 
-                                max(1, info.get('keyspace_hits', 0) + info.get('keyspace_misses', 0)) * 100, 2)
-            }
+            cache_stats = get_cache_stats()
         
         return jsonify({
             'lookups_24h': stats['total_lookups'] or 0,
@@ -645,6 +1077,15 @@ def property_docs():
                     'state': 'string (optional)'
                 }
             },
+            '/api/property/batch_async': {
+                'method': 'POST',
+                'description': 'Same as /api/property/batch, with async HTTP fan-out for requests-strategy counties',
+                'body': {
+                    'addresses': ['array of strings'],
+                    'county': 'string (optional)',
+                    'state': 'string (optional)'
+                }
+            },
             '/api/property/counties': {
                 'method': 'GET',
                 'description': 'List supported counties with optimized strategies'
@@ -659,8 +1100,8 @@ def property_docs():
         'cache_duration': '24 hours'
     }), 200
 
-if __name__ == '__main__':
-    # Create database table if needed
+def init_database():
+    """Create the property_lookups table and indexes if needed"""
     if db_manager:
         db_manager.execute("""
         CREATE TABLE IF NOT EXISTS property_lookups (
@@ -678,7 +1119,16 @@ if __name__ == '__main__':
         # Create indexes
         db_manager.execute("CREATE INDEX IF NOT EXISTS idx_address ON property_lookups(address)")
         db_manager.execute("CREATE INDEX IF NOT EXISTS idx_lookup_date ON property_lookups(lookup_date)")
-    
+        
+        # Runs in the Gunicorn master before fork; don't hand this connection to workers
+        db_manager.close()
+        db_manager.connection = None
+        db_manager.cursor = None
+
+# Production server: multi-worker gthread Gunicorn, see property_gunicorn_config.py
+GUNICORN_COMMAND = ['gunicorn', '-c', 'property_gunicorn_config.py', 'property_wsgi:application']
+
+if __name__ == '__main__':
     # Print API key
     print(f"\n{'='*60}")
     print(f"Property Owner Lookup API Starting...")
@@ -686,8 +1136,11 @@ if __name__ == '__main__':
     print(f"API Key: {PROPERTY_API_KEY}")
     print(f"Cache: {'Enabled' if CACHE_ENABLED else 'Disabled'}")
     print(f"Counties: {len(PropertyOwnerExtractor.COUNTY_CONFIGS)} configured")
+    print(f"Server: {' '.join(GUNICORN_COMMAND)}")
     print(f"{'='*60}\n")
     
-    # Run server
-    port = int(os.environ.get('PROPERTY_PORT', 5002))
-    app.run(host='0.0.0.0', port=port, debug=False)
\ No newline at end of file
+    # Workers re-import this module; pass the printed key on so they all accept it
+    os.environ['PROPERTY_API_KEY'] = PROPERTY_API_KEY
+    
+    # Hand the process over to Gunicorn instead of the single-process dev server
+    os.execvp(GUNICORN_COMMAND[0], GUNICORN_COMMAND)
@@ -0,0 +1,183 @@
+"""
+Property field extraction patterns
+Regex extraction behind PropertyOwnerExtractor.extract_with_patterns, kept
+free of the API's Flask/Redis/Selenium imports
+"""
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    hyperscan = None
+    HYPERSCAN_AVAILABLE = False
+
+# Common patterns for extracting property data; earlier patterns take priority
+EXTRACTION_PATTERNS = {
+    "owner": [
+        r"Owner(?:\s+Name)?[:\s]+([^\n]+)",
+        r"Property\s+Owner[:\s]+([^\n]+)",
+        r"Deed\s+Holder[:\s]+([^\n]+)",
+        r"Name[:\s]+([^\n]+)",
+        r"Current\s+Owner[:\s]+([^\n]+)",
+        r"Taxpayer[:\s]+([^\n]+)",
+        r"Grantee[:\s]+([^\n]+)"
+    ],
+    "parcel": [
+        r"(?:Parcel|APN|PIN|Account)(?:\s+(?:Number|ID|#))?[:\s]+([A-Z0-9\-]+)",
+        r"Tax\s+ID[:\s]+([A-Z0-9\-]+)",
+        r"Folio(?:\s+Number)?[:\s]+([0-9\-]+)",
+        r"Property\s+ID[:\s]+([A-Z0-9\-]+)"
+    ],
+    "address": [
+        r"(?:Property|Site|Situs)\s+Address[:\s]+([^\n]+)",
+        r"Location[:\s]+([^\n]+)",
+        r"Physical\s+Address[:\s]+([^\n]+)"
+    ],
+    "mailing": [
+        r"(?:Mailing|Owner)\s+Address[:\s]+([^\n]+)",
+        r"Tax\s+Bill\s+Address[:\s]+([^\n]+)",
+        r"Correspondence\s+Address[:\s]+([^\n]+)"
+    ],
+    "value": [
+        r"(?:Assessed|Total)\s+Value[:\s]+\$?([0-9,]+)",
+        r"Market\s+Value[:\s]+\$?([0-9,]+)",
+        r"Taxable\s+Value[:\s]+\$?([0-9,]+)",
+        r"Fair\s+Market\s+Value[:\s]+\$?([0-9,]+)"
+    ]
+}
+
+# Whitespace runs collapsed before pattern extraction
+_WS_RE = re.compile(r'\s+')
+
+# Page text scanned by extract_fields; assessor result pages are small
+MAX_EXTRACT_CHARS = 200_000
+
+# Numeric cleanup for extracted values
+_COMMA_KILL = str.maketrans('', '', ',$ ')
+
+# First unescaped capturing "(" in a pattern
+_CAPTURE_GROUP_RE = re.compile(r'(?<!\\)\((?!\?)')
+
+
+def build_fused_pattern(patterns: Dict[str, List[str]], include: frozenset = None) -> Dict[str, re.Pattern]:
+    """
+    Fuse each field's extraction patterns into one case-insensitive regex.
+
+    Fields get separate regexes so overlapping labels from different fields
+    (e.g. "Owner Address" is both an owner and a mailing label) are each
+    found. Within a field, each pattern's capture group is renamed to
+    "<field>__<index>" so the matching pattern can be read from
+    match.lastgroup. If include is given, only patterns with those group
+    names are fused.
+    """
+    fused = {}
+    for field, field_patterns in patterns.items():
+        alternatives = []
+        for index, pattern in enumerate(field_patterns):
+            name = f'{field}__{index}'
+            if include is not None and name not in include:
+                continue
+            named = _CAPTURE_GROUP_RE.sub(f'(?P<{name}>', pattern, count=1)
+            alternatives.append(f'(?:{named})')
+        if alternatives:
+            fused[field] = re.compile('|'.join(alternatives), re.IGNORECASE)
+    return fused
+
+
+def build_hyperscan_database(patterns: Dict[str, List[str]]) -> Tuple[object, List[str]]:
+    """
+    Compile extraction patterns into a Hyperscan database used as a prefilter.
+
+    Returns the database and the group name for each pattern id. Patterns
+    are compiled caseless and single-match since only the set of patterns
+    present in the text is needed.
+    """
+    names = []
+    expressions = []
+    for field, field_patterns in patterns.items():
+        for index, pattern in enumerate(field_patterns):
+            names.append(f'{field}__{index}')
+            expressions.append(_CAPTURE_GROUP_RE.sub('(?:', pattern).encode())
+
+    database = hyperscan.Database()
+    database.compile(
+        expressions=expressions,
+        ids=list(range(len(expressions))),
+        elements=len(expressions),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(expressions)
+    )
+    return database, names
+
+
+# EXTRACTION_PATTERNS fused into one regex per field, plus each pattern on its own
+FUSED_PATTERNS = build_fused_pattern(EXTRACTION_PATTERNS)
+COMPILED_PATTERNS = {
+    field: [re.compile(pattern, re.IGNORECASE) for pattern in field_patterns]
+    for field, field_patterns in EXTRACTION_PATTERNS.items()
+}
+
+
+@lru_cache(maxsize=256)
+def fused_pattern_subset(include: frozenset) -> Dict[str, re.Pattern]:
+    """Fused per-field patterns restricted to the given group names (memoized per subset)"""
+    return build_fused_pattern(EXTRACTION_PATTERNS, include)
+
+
+def clean_text(text: str) -> str:
+    """Bound text to MAX_EXTRACT_CHARS and collapse whitespace runs"""
+    return _WS_RE.sub(' ', text[:MAX_EXTRACT_CHARS])
+
+
+def _first_by_priority(field: str, fused: re.Pattern, text: str, include: frozenset = None) -> Optional[str]:
+    """
+    Captured value of the field's highest-priority pattern that occurs in text.
+
+    The fused regex returns the leftmost hit of any pattern. Patterns listed
+    after the one that hit can't outrank it, and patterns listed before it
+    didn't match at or before that position, so only those are searched,
+    from just past the hit, stopping at the first that matches. A hit from
+    the field's first pattern needs no further search.
+    """
+    match = fused.search(text)
+    if match is None:
+        return None
+
+    index = int(match.lastgroup.rsplit('__', 1)[1])
+    for earlier, pattern in enumerate(COMPILED_PATTERNS[field][:index]):
+        if include is not None and f'{field}__{earlier}' not in include:
+            continue
+        earlier_match = pattern.search(text, match.start() + 1)
+        if earlier_match:
+            return earlier_match.group(1)
+    return match.group(match.lastgroup)
+
+
+def extract_fields(text: str, include: frozenset = None) -> Dict:
+    """
+    Extract property fields from text already passed through clean_text.
+
+    For each field the first pattern in EXTRACTION_PATTERNS that matches
+    wins, at its leftmost position. If include is given (group names from
+    a prefilter), only those patterns are tried.
+    """
+    results = {}
+    fused = FUSED_PATTERNS if include is None else fused_pattern_subset(include)
+
+    for field, pattern in fused.items():
+        value = _first_by_priority(field, pattern, text, include)
+        if value is None:
+            continue
+
+        # Clean up value
+        value = _WS_RE.sub(' ', value.strip())
+        value = value.strip(' ,.')
+
+        if field == "value" and value:
+            # Convert to float
+            value = float(value.translate(_COMMA_KILL))
+
+        results[field] = value
+
+    return results
@@ -0,0 +1,9 @@
+"""
+WSGI entry point for the Property Owner Lookup API
+Run with: gunicorn -c property_gunicorn_config.py property_wsgi:application
+"""
+
+from property_owner_api import app
+
+# Tables are created once in the Gunicorn master, see on_starting in property_gunicorn_config.py
+application = app
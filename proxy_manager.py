@@ -5,13 +5,63 @@ import os
 import requests
 import random
 import json
+import math
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import NamedTuple, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Webshare proxy list API (backbone mode for residential proxies)
+WEBSHARE_LIST_URL = 'https://proxy.webshare.io/api/v2/proxy/list/?mode=backbone&page={page}&page_size={page_size}'
+WEBSHARE_PAGE_SIZE = 100
+WEBSHARE_PAGE_WORKERS = 8
+BACKBONE_HOST = "p.webshare.io"  # Backbone server for residential proxies
+
+class Proxy(NamedTuple):
+    """One proxy endpoint; tuple-backed, so no per-instance __dict__"""
+    url: str
+    address: Optional[str] = None
+    port: Optional[int] = None
+    username: Optional[str] = None
+    password: Optional[str] = None
+    country: str = 'Unknown'
+    session_id: Optional[int] = None
+    type: Optional[str] = None
 
 class ProxyManager:
     def __init__(self, api_key=None):
         self.api_key = api_key or os.environ.get("WEBSHARE_API_KEY")
+        self._rng = random.Random()
         self.proxies = []
-        self.current_index = 0
+        self._lock = threading.Lock()
         
+        # Keep-alive session shared by Webshare API calls and proxy tests
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        
+    @property
+    def proxies(self):
+        return self._proxies
+    
+    @proxies.setter
+    def proxies(self, proxies):
+        self._proxies = proxies
+        
+        # Rotation order is precomputed; each entry carries the index that follows it
+        self._cycle = itertools.cycle([
+            (proxy, (i + 1) % len(proxies)) for i, proxy in enumerate(proxies)
+        ])
+        self.current_index = 0
+    
     def fetch_proxies_from_webshare(self):
         """Fetch proxy list from Webshare.io API"""
         if not self.api_key:
@@ -19,50 +69,94 @@ class ProxyManager:
             return []
         
         try:
-            import requests
-            
             # Fetch proxies from API
             headers = {'Authorization': f'Token {self.api_key}'}
             
-            # For residential proxies, use backbone mode
-            proxy_url = 'https://proxy.webshare.io/api/v2/proxy/list/?mode=backbone&page=1&page_size=100'
-            response = requests.get(proxy_url, headers=headers, timeout=30)
-            
+            # First page tells us how many pages there are
+            response = self._fetch_webshare_page(1, headers)
             if response.status_code != 200:
                 print(f"Failed to fetch proxies: {response.status_code}")
                 return []
             
             data = response.json()
-            proxies = []
-            backbone_host = "p.webshare.io"  # Backbone server for residential proxies
+            count = data.get('count', 0)
+            pages = [data]
             
-            for proxy_data in data.get('results', []):
-                # Build proxy URL for backbone mode
-                username = proxy_data['username']
-                password = proxy_data['password']
-                port = proxy_data['port']
-                
-                proxy_url = f"http://{username}:{password}@{backbone_host}:{port}"
-                proxies.append({
-                    'url': proxy_url,
-                    'address': backbone_host,
-                    'port': port,
-                    'username': username,
-                    'password': password,
-                    'session_id': proxy_data.get('id'),
-                    'country': proxy_data.get('country_code', 'Unknown'),
-                    'type': 'residential'
-                })
+            # Fetch the remaining pages concurrently
+            n_pages = math.ceil(count / WEBSHARE_PAGE_SIZE)
+            if n_pages > 1:
+                with ThreadPoolExecutor(max_workers=WEBSHARE_PAGE_WORKERS) as executor:
+                    for page_data in executor.map(
+                        lambda page: self._fetch_webshare_page_data(page, headers), range(2, n_pages + 1)
+                    ):
+                        if page_data is not None:
+                            pages.append(page_data)
+            
+            # Preallocated for the advertised count; duplicates across pages are skipped
+            proxies = [None] * count
+            seen = set()
+            loaded = 0
+            for page_data in pages:
+                for proxy_data in page_data.get('results', []):
+                    if proxy_data.get('id') in seen:
+                        continue
+                    seen.add(proxy_data.get('id'))
+                    
+                    proxy = self._webshare_proxy(proxy_data)
+                    if loaded < count:
+                        proxies[loaded] = proxy
+                    else:
+                        proxies.append(proxy)
+                    loaded += 1
+            del proxies[loaded:]
             
             self.proxies = proxies
             print(f"Loaded {len(proxies)} residential proxies from Webshare.io")
-            print(f"Total available: {data.get('count', 0)}")
+            print(f"Total available: {count}")
             return proxies
                 
         except Exception as e:
             print(f"Error fetching Webshare proxies: {e}")
             return []
     
+    def _fetch_webshare_page(self, page, headers):
+        """Request one page of the Webshare proxy list"""
+        proxy_url = WEBSHARE_LIST_URL.format(page=page, page_size=WEBSHARE_PAGE_SIZE)
+        return self._session.get(proxy_url, headers=headers, timeout=30)
+    
+    def _fetch_webshare_page_data(self, page, headers):
+        """Decoded page of the Webshare proxy list, or None if that page failed"""
+        try:
+            response = self._fetch_webshare_page(page, headers)
+            if response.status_code != 200:
+                print(f"Failed to fetch proxy page {page}: {response.status_code}")
+                return None
+            return response.json()
+        except Exception as e:
+            # One bad page shouldn't discard the others
+            print(f"Failed to fetch proxy page {page}: {e}")
+            return None
+    
+    @staticmethod
+    def _webshare_proxy(proxy_data):
+        """Build our proxy entry from a Webshare list result"""
+        # Build proxy URL for backbone mode
+        username = proxy_data['username']
+        password = proxy_data['password']
+        port = proxy_data['port']
+        
+        proxy_url = f"http://{username}:{password}@{BACKBONE_HOST}:{port}"
+        return Proxy(
+            url=proxy_url,
+            address=BACKBONE_HOST,
+            port=port,
+            username=username,
+            password=password,
+            session_id=proxy_data.get('id'),
+            country=proxy_data.get('country_code', 'Unknown'),
+            type='residential'
+        )
+    
     def load_proxies_from_file(self, filepath='proxies.json'):
         """Load proxies from a local JSON file"""
         try:
@@ -74,19 +168,21 @@ class ProxyManager:
                 proxies = []
                 for proxy in proxy_data:
                     if 'url' in proxy:
-                        proxies.append(proxy)
+                        proxy_url = proxy['url']
                     else:
                         # Build URL from components
                         auth = f"{proxy['username']}:{proxy['password']}@" if proxy.get('username') else ""
                         proxy_url = f"http://{auth}{proxy['host']}:{proxy['port']}"
-                        proxies.append({
-                            'url': proxy_url,
-                            'address': proxy.get('host', proxy.get('address')),
-                            'port': proxy['port'],
-                            'username': proxy.get('username'),
-                            'password': proxy.get('password'),
-                            'country': proxy.get('country', 'Unknown')
-                        })
+                    proxies.append(Proxy(
+                        url=proxy_url,
+                        address=proxy.get('host', proxy.get('address')),
+                        port=proxy.get('port'),
+                        username=proxy.get('username'),
+                        password=proxy.get('password'),
+                        country=proxy.get('country', 'Unknown'),
+                        session_id=proxy.get('session_id'),
+                        type=proxy.get('type')
+                    ))
                 
                 self.proxies = proxies
                 print(f"Loaded {len(proxies)} proxies from {filepath}")
@@ -99,15 +195,14 @@ class ProxyManager:
         """Get a random proxy from the list"""
         if not self.proxies:
             return None
-        return random.choice(self.proxies)
+        return self._rng.choice(self.proxies)
     
     def get_next_proxy(self):
         """Get the next proxy in rotation"""
         if not self.proxies:
             return None
         
-        proxy = self.proxies[self.current_index]
-        self.current_index = (self.current_index + 1) % len(self.proxies)
+        proxy, self.current_index = next(self._cycle)
         return proxy
     
     def get_proxy_dict(self, proxy=None):
@@ -118,8 +213,19 @@ class ProxyManager:
         if not proxy:
             return None
         
-        proxy_url = proxy['url'] if isinstance(proxy, dict) else proxy
+        if isinstance(proxy, Proxy):
+            proxy_url = proxy.url
+        elif isinstance(proxy, dict):
+            proxy_url = proxy['url']
+        else:
+            proxy_url = proxy
         
+        return self._dict_for_url(proxy_url)
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _dict_for_url(proxy_url):
+        """Shared requests proxies mapping per proxy URL; callers must not mutate it"""
         return {
             'http': proxy_url,
             'https': proxy_url
@@ -136,9 +242,10 @@ class ProxyManager:
         
         try:
             proxy_dict = self.get_proxy_dict(proxy)
-            response = requests.get(
+            response = self._session.get(
                 'http://httpbin.org/ip',
                 proxies=proxy_dict,
+                headers={'Connection': 'keep-alive'},
                 timeout=10
             )
             
@@ -154,5 +261,37 @@ class ProxyManager:
             print(f"Proxy test failed: {e}")
             return False
 
+    def _check_proxy(self, proxy, url, timeout):
+        """Quiet health check used by test_all_proxies"""
+        try:
+            response = self._session.get(
+                url,
+                proxies=self.get_proxy_dict(proxy),
+                headers={'Connection': 'keep-alive'},
+                timeout=timeout
+            )
+            return response.status_code == 200
+        except Exception:
+            return False
+    
+    def test_all_proxies(self, concurrency=32, url='http://httpbin.org/ip', timeout=10):
+        """Test every proxy in parallel and keep only the working ones"""
+        proxies = list(self.proxies)
+        if not proxies:
+            print("No proxies to test")
+            return []
+        
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(zip(proxies, executor.map(
+                lambda proxy: self._check_proxy(proxy, url, timeout), proxies
+            )))
+        
+        working = [proxy for proxy, ok in results if ok]
+        with self._lock:
+            self.proxies = working
+        
+        print(f"Proxy test: {len(working)}/{len(proxies)} working")
+        return results
+
 # Initialize global proxy manager
-proxy_manager = ProxyManager()
\ No newline at end of file
+proxy_manager = ProxyManager()
@@ -3,9 +3,161 @@ Recipe Manager - Save and reuse scraping configurations
 """
 import json
 import os
+import re
+import mmap
+import time
+import itertools
+import atexit
+import threading
+from collections import defaultdict
+from collections.abc import Mapping, MutableMapping
+from types import MappingProxyType
 from datetime import datetime
 from typing import Dict, List, Optional
 import uuid
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Consolidated recipe store inside storage_path: one JSON record per line,
+# appended on every write; the last record for an id wins and a
+# {"id": ..., "deleted": true} record removes it
+RECIPE_STORE = "recipes.ndjson"
+
+# Sidecar holding {id: {"usage_count", "last_used"}}; execute_recipe only
+# touches these two fields, so flushing them never rewrites recipe configs
+STATS_FILE = "_stats.json"
+
+# Rewrite the store on load once it holds this many stale records
+COMPACT_THRESHOLD = 64
+
+# Usage stats from execute_recipe are written in batches: after this many
+# recipes changed, or this many seconds after the last flush
+STATS_FLUSH_BATCH = 32
+STATS_FLUSH_INTERVAL = 5.0
+
+
+def _dumps_line(record: Dict) -> bytes:
+    """Encode a store record as one newline-terminated JSON line"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record) + "\n").encode()
+
+
+def _atomic_write(path: str, payload: bytes):
+    """Write a file via a synced temp file and rename, so readers never see a partial write"""
+    tmp = path + '.tmp'
+    with open(tmp, 'wb', buffering=1 << 16) as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+_id_counter = itertools.count()
+
+
+def new_recipe_id(secure: bool = False) -> str:
+    """
+    New recipe id: wall-clock ns, pid and a per-process counter in hex.
+    
+    Unique without reading /dev/urandom; pass secure=True for an
+    unpredictable uuid4 instead.
+    """
+    if secure:
+        return str(uuid.uuid4())
+    return f"{time.time_ns():x}{os.getpid():x}-{next(_id_counter):x}"
+
+
+def _trigrams(text: str) -> set:
+    """Lowercase character trigrams of text"""
+    text = text.lower()
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _recipe_trigrams(recipe: Dict) -> set:
+    """Trigrams of a recipe's name and tags, the fields search_recipes matches"""
+    grams = _trigrams(recipe["name"])
+    for tag in recipe.get("tags", []):
+        grams |= _trigrams(tag)
+    return grams
+
+
+def _freeze(value):
+    """Read-only copy of nested dicts/lists (MappingProxyType/tuple)"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value):
+    """Mutable dict/list copy of a value built by _freeze"""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+def _loads(raw: bytes) -> Dict:
+    """Decode a JSON store record"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Store records always start with the id and tombstones end with the flag,
+# so both can be read from raw bytes without decoding the record
+_RECORD_ID_RE = re.compile(rb'^\{"id": ?"([^"]*)"')
+_TOMBSTONE_RE = re.compile(rb'"deleted": ?true\}\s*$')
+
+
+class LazyRecipes(MutableMapping):
+    """
+    id -> recipe mapping over the recipe store that decodes each record
+    on first access. Offsets point into a read-only mmap of the store
+    taken at load time; recipes created or changed since are held in memory.
+    Usage stats from the sidecar are overlaid on each decoded record.
+    """
+    
+    def __init__(self, mm: Optional[mmap.mmap], offsets: Dict[str, int], stats: Dict[str, Dict]):
+        self._mm = mm
+        self._offsets = offsets
+        self._stats = stats
+        self._loaded = {}
+    
+    def __getitem__(self, recipe_id):
+        recipe = self._loaded.get(recipe_id)
+        if recipe is None:
+            offset = self._offsets[recipe_id]
+            end = self._mm.find(b"\n", offset)
+            if end == -1:
+                end = len(self._mm)
+            recipe = self._loaded[recipe_id] = _loads(self._mm[offset:end])
+            recipe.update(self._stats.get(recipe_id, ()))
+        return recipe
+    
+    def __setitem__(self, recipe_id, recipe):
+        self._loaded[recipe_id] = recipe
+        self._offsets.setdefault(recipe_id, None)
+    
+    def __delitem__(self, recipe_id):
+        del self._offsets[recipe_id]
+        self._loaded.pop(recipe_id, None)
+    
+    def __contains__(self, recipe_id):
+        return recipe_id in self._offsets
+    
+    def __iter__(self):
+        return iter(self._offsets)
+    
+    def __len__(self):
+        return len(self._offsets)
 
 class RecipeManager:
     """
@@ -14,11 +166,69 @@ class RecipeManager:
     
     def __init__(self, storage_path: str = "recipes"):
         self.storage_path = storage_path
+        self.store_path = os.path.join(storage_path, RECIPE_STORE)
+        self.stats_path = os.path.join(storage_path, STATS_FILE)
         if not os.path.exists(storage_path):
             os.makedirs(storage_path)
+        self._stats = self._load_stats()
         self.recipes = self._load_all_recipes()
+        
+        # name -> id, tag -> {ids} and name/tag trigram -> {ids}, built on first
+        # use (it decodes every recipe) and then kept in sync by create/update/delete
+        self._name_index = {}
+        self._tag_index = defaultdict(set)
+        self._trigram_index = defaultdict(set)
+        self._indexed = False
+        
+        # Recipes whose usage stats haven't been written yet
+        self._dirty_ids = set()
+        self._last_flush = time.monotonic()
+        self._flush_timer = None
+        self._lock = threading.Lock()
+        atexit.register(self.flush)
+    
+    def _ensure_indexes(self):
+        """Build the name and tag indexes if they haven't been yet"""
+        if not self._indexed:
+            self._indexed = True
+            for recipe in self.recipes.values():
+                self._index_recipe(recipe)
     
-    def create_recipe(self, name: str, config: Dict) -> Dict:
+    def _index_recipe(self, recipe: Dict):
+        """Add a recipe to the name and tag indexes"""
+        if not self._indexed:
+            return
+        # First recipe with a given name wins, as with the old linear scan
+        self._name_index.setdefault(recipe["name"], recipe["id"])
+        for tag in recipe.get("tags", []):
+            self._tag_index[tag].add(recipe["id"])
+        for gram in _recipe_trigrams(recipe):
+            self._trigram_index[gram].add(recipe["id"])
+    
+    def _unindex_recipe(self, recipe: Dict):
+        """Remove a recipe from the name and tag indexes"""
+        if not self._indexed:
+            return
+        
+        name = recipe["name"]
+        if self._name_index.get(name) == recipe["id"]:
+            del self._name_index[name]
+            # Another recipe may share the name
+            for other in self.recipes.values():
+                if other["name"] == name and other["id"] != recipe["id"]:
+                    self._name_index[name] = other["id"]
+                    break
+        
+        for index, keys in ((self._tag_index, recipe.get("tags", [])),
+                            (self._trigram_index, _recipe_trigrams(recipe))):
+            for key in keys:
+                ids = index.get(key)
+                if ids:
+                    ids.discard(recipe["id"])
+                    if not ids:
+                        del index[key]
+    
+    def create_recipe(self, name: str, config: Dict, secure_id: bool = False) -> Dict:
         """
         Create a new scraping recipe
         
@@ -40,8 +250,9 @@ class RecipeManager:
                         "screenshot": false
                     }
                 }
+            secure_id: Use an unpredictable uuid4 id instead of the fast default
         """
-        recipe_id = str(uuid.uuid4())
+        recipe_id = new_recipe_id(secure=secure_id)
         recipe = {
             "id": recipe_id,
             "name": name,
@@ -54,12 +265,11 @@ class RecipeManager:
             "tags": config.get("tags", [])
         }
         
-        # Save to file
-        filepath = os.path.join(self.storage_path, f"{recipe_id}.json")
-        with open(filepath, 'w') as f:
-            json.dump(recipe, f, indent=2)
+        # Save to store
+        self._append(recipe)
         
         self.recipes[recipe_id] = recipe
+        self._index_recipe(recipe)
         return recipe
     
     def get_recipe(self, recipe_id: str) -> Optional[Dict]:
@@ -68,20 +278,17 @@ class RecipeManager:
     
     def get_recipe_by_name(self, name: str) -> Optional[Dict]:
         """Get recipe by name"""
-        for recipe in self.recipes.values():
-            if recipe["name"] == name:
-                return recipe
-        return None
+        self._ensure_indexes()
+        return self.recipes.get(self._name_index.get(name))
     
     def list_recipes(self, tags: List[str] = None) -> List[Dict]:
         """List all recipes, optionally filtered by tags"""
-        recipes = list(self.recipes.values())
-        
         if tags:
-            recipes = [
-                r for r in recipes 
-                if any(tag in r.get("tags", []) for tag in tags)
-            ]
+            self._ensure_indexes()
+            ids = set().union(*(self._tag_index.get(tag, ()) for tag in tags))
+            recipes = [self.recipes[recipe_id] for recipe_id in ids]
+        else:
+            recipes = list(self.recipes.values())
         
         return sorted(recipes, key=lambda x: x["created_at"], reverse=True)
     
@@ -91,15 +298,15 @@ class RecipeManager:
             return None
         
         recipe = self.recipes[recipe_id]
+        self._unindex_recipe(recipe)
         recipe["config"].update(updates.get("config", {}))
         recipe["name"] = updates.get("name", recipe["name"])
         recipe["tags"] = updates.get("tags", recipe["tags"])
         recipe["updated_at"] = datetime.now().isoformat()
+        self._index_recipe(recipe)
         
-        # Save to file
-        filepath = os.path.join(self.storage_path, f"{recipe_id}.json")
-        with open(filepath, 'w') as f:
-            json.dump(recipe, f, indent=2)
+        # Save to store
+        self._append(recipe)
         
         return recipe
     
@@ -108,12 +315,13 @@ class RecipeManager:
         if recipe_id not in self.recipes:
             return False
         
-        # Delete file
-        filepath = os.path.join(self.storage_path, f"{recipe_id}.json")
-        if os.path.exists(filepath):
-            os.remove(filepath)
+        # Record the deletion in the store
+        self._append({"id": recipe_id, "deleted": True})
+        with self._lock:
+            if self._stats.pop(recipe_id, None) is not None:
+                self._dirty_ids.add(recipe_id)
         
-        del self.recipes[recipe_id]
+        self._unindex_recipe(self.recipes.pop(recipe_id))
         return True
     
     def execute_recipe(self, recipe_id: str, url: str = None) -> Dict:
@@ -134,31 +342,137 @@ class RecipeManager:
         recipe["usage_count"] += 1
         recipe["last_used"] = datetime.now().isoformat()
         
-        # Save updated stats
-        filepath = os.path.join(self.storage_path, f"{recipe_id}.json")
-        with open(filepath, 'w') as f:
-            json.dump(recipe, f, indent=2)
+        # Save updated stats to the sidecar in batches
+        with self._lock:
+            self._stats[recipe_id] = {
+                "usage_count": recipe["usage_count"],
+                "last_used": recipe["last_used"]
+            }
+            self._dirty_ids.add(recipe_id)
+            due = (len(self._dirty_ids) > STATS_FLUSH_BATCH or
+                   time.monotonic() - self._last_flush > STATS_FLUSH_INTERVAL)
+            if not due and self._flush_timer is None:
+                self._flush_timer = threading.Timer(STATS_FLUSH_INTERVAL, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        
+        if due:
+            self.flush()
         
         return config
     
+    def flush(self):
+        """Write pending usage stats to the sidecar"""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            
+            dirty = bool(self._dirty_ids)
+            self._dirty_ids.clear()
+            self._last_flush = time.monotonic()
+            
+            if dirty:
+                _atomic_write(self.stats_path, _dumps_line(self._stats))
+    
+    def _load_stats(self) -> Dict[str, Dict]:
+        """Load the usage stats sidecar"""
+        if not os.path.exists(self.stats_path):
+            return {}
+        try:
+            with open(self.stats_path, 'rb') as f:
+                return _loads(f.read())
+        except Exception as e:
+            print(f"Error loading recipe stats: {e}")
+            return {}
+    
+    def _append(self, record: Dict):
+        """Append one record to the recipe store"""
+        with open(self.store_path, 'ab') as f:
+            f.write(_dumps_line(record))
+    
+    def _write_all(self, recipes: Dict):
+        """Rewrite the recipe store with one record per live recipe"""
+        _atomic_write(self.store_path, b"".join(_dumps_line(recipe) for recipe in recipes.values()))
+    
     def _load_all_recipes(self) -> Dict:
         """Load all recipes from storage"""
+        if os.path.exists(self.store_path):
+            return self._load_store()
+        
+        # First run on per-recipe JSON files: migrate them into the store
+        recipes = self._load_recipe_files()
+        if recipes:
+            self._write_all(recipes)
+        return recipes
+    
+    def _load_store(self) -> MutableMapping:
+        """Index the recipe store; records are decoded lazily on access"""
+        mm, offsets, records = self._scan_index()
+        
+        # Drop superseded and deleted records once they pile up
+        if records - len(offsets) >= COMPACT_THRESHOLD:
+            self._write_all(dict(LazyRecipes(mm, offsets, self._stats)))
+            mm.close()
+            mm, offsets, records = self._scan_index()
+        
+        return LazyRecipes(mm, offsets, self._stats)
+    
+    def _scan_index(self):
+        """Map the store and record the offset of each recipe's latest record"""
+        offsets = {}
+        records = 0
+        with open(self.store_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None, offsets, records
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        offset = 0
+        while offset < len(mm):
+            line = mm.readline()
+            match = _RECORD_ID_RE.match(line)
+            if match:
+                records += 1
+                recipe_id = match.group(1).decode()
+                if _TOMBSTONE_RE.search(line):
+                    offsets.pop(recipe_id, None)
+                else:
+                    offsets[recipe_id] = offset
+            elif line.strip():
+                print(f"Error loading recipe record at offset {offset}")
+            offset += len(line)
+        
+        return mm, offsets, records
+    
+    def _load_recipe_files(self) -> Dict:
+        """Load recipes from legacy one-file-per-recipe storage"""
         recipes = {}
         if not os.path.exists(self.storage_path):
             return recipes
         
-        for filename in os.listdir(self.storage_path):
-            if filename.endswith('.json'):
-                filepath = os.path.join(self.storage_path, filename)
-                try:
-                    with open(filepath, 'r') as f:
-                        recipe = json.load(f)
-                        recipes[recipe["id"]] = recipe
-                except Exception as e:
-                    print(f"Error loading recipe {filename}: {e}")
+        with os.scandir(self.storage_path) as entries:
+            for entry in entries:
+                if entry.name.endswith('.json') and entry.name != STATS_FILE and entry.is_file():
+                    try:
+                        with open(entry.path, 'rb') as f:
+                            recipe = _loads(f.read())
+                            recipes[recipe["id"]] = recipe
+                    except Exception as e:
+                        print(f"Error loading recipe {entry.name}: {e}")
         
         return recipes
     
+    def seed_defaults(self) -> int:
+        """Create DEFAULT_RECIPES if there are no recipes yet; returns how many were created"""
+        if len(self.recipes) > 0:
+            return 0
+        
+        for default in DEFAULT_RECIPES:
+            config = _thaw(default["config"])
+            config.setdefault("tags", _thaw(default["tags"]))
+            self.create_recipe(name=default["name"], config=config)
+        return len(DEFAULT_RECIPES)
+    
     def get_popular_recipes(self, limit: int = 10) -> List[Dict]:
         """Get most used recipes"""
         recipes = list(self.recipes.values())
@@ -169,15 +483,28 @@ class RecipeManager:
         query = query.lower()
         results = []
         
-        for recipe in self.recipes.values():
+        # Only recipes containing every trigram of the query can match
+        if len(query) >= 3:
+            self._ensure_indexes()
+            grams = sorted(_trigrams(query), key=lambda g: len(self._trigram_index.get(g, ())))
+            ids = set(self._trigram_index.get(grams[0], ()))
+            for gram in grams[1:]:
+                if not ids:
+                    break
+                ids &= self._trigram_index.get(gram, set())
+            candidates = sorted((self.recipes[i] for i in ids), key=lambda r: r["created_at"])
+        else:
+            candidates = self.recipes.values()
+        
+        for recipe in candidates:
             if (query in recipe["name"].lower() or
                 any(query in tag.lower() for tag in recipe.get("tags", []))):
                 results.append(recipe)
         
         return results
 
-# Predefined recipes for common use cases
-DEFAULT_RECIPES = [
+# Predefined recipes for common use cases, frozen so seeding can't alias them
+DEFAULT_RECIPES = _freeze([
     {
         "name": "E-commerce Product Scraper",
         "config": {
@@ -277,7 +604,7 @@ DEFAULT_RECIPES = [
         },
         "tags": ["jobs", "careers", "employment"]
     }
-]
+])
 
 # Global instance
 recipe_manager = RecipeManager()
\ No newline at end of file
@@ -7,20 +7,114 @@ import random
 import time
 import threading
 from typing import Dict, List, Optional, Tuple, Any
-from collections import deque
+from collections import deque, OrderedDict
 from datetime import datetime, timedelta
 import numpy as np
 import logging
 from urllib.parse import urlparse, urljoin
+from functools import lru_cache
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    njit = None
+    NUMBA_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Uniform draws are pulled from NumPy in blocks of this size
+RAND_BUFFER_SIZE = 4096
+# Number of recent requests kept for pattern analysis
+HISTORY_SIZE = 1000
+# Most recent referrer chains kept in referrer_chains
+REFERRER_CHAIN_LIMIT = 2048
+
+# Delay multiplier per resource type
+_RESOURCE_MULT = {
+    'document': 1.0,
+    'image': 0.1,  # Images load faster
+    'script': 0.2,
+    'style': 0.15,
+    'font': 0.1,
+    'xhr': 0.3,  # AJAX requests
+    'fetch': 0.3,
+    'other': 0.5
+}
+# Same multipliers indexed by integer code; unknown types use the trailing 1.0 slot
+_RESOURCE_CODE = {name: i for i, name in enumerate(_RESOURCE_MULT)}
+_RESOURCE_MULT_ARR = np.array(list(_RESOURCE_MULT.values()) + [1.0], dtype=np.float64)
+
+# Resource Timing duration range (ms) per resource type
+_TYPE_DELAYS = {
+    'script': (50, 500),
+    'style': (30, 300),
+    'image': (100, 1000),
+    'font': (20, 200),
+    'fetch': (50, 300),
+    'other': (50, 500)
+}
+
+def _compute_delays(u, resource_mult, min_d, max_d, burst_p, idle_p, jitter_lo, jitter_hi, jitter):
+    """Delay formula over a (7, n) block of uniform draws, shared by the scalar and batched APIs"""
+    delays = (min_d + (max_d - min_d) * u[0]) * resource_mult
+    delays = np.where(u[1] < burst_p, delays * 0.1, delays)  # Much faster during bursts
+    delays = np.where(u[2] < idle_p, delays * (5.0 + 15.0 * u[3]), delays)  # Much slower when idle
+    if jitter:
+        # Microsecond jitter, plus an occasional human-like hesitation
+        delays += jitter_lo + (jitter_hi - jitter_lo) * u[4]
+        delays += (u[5] < 0.05) * (0.1 + 0.4 * u[6])
+    return delays
+
+
+if NUMBA_AVAILABLE:
+    # Same function compiled, so the NumPy and JIT paths can't drift apart
+    _compute_delays = njit(cache=True, fastmath=True)(_compute_delays)
+
+
+@lru_cache(maxsize=4096)
+def _cached_urlparse(url: str):
+    """urlparse memoized for hosts and pages that are requested repeatedly"""
+    return urlparse(url)
+
+
+@lru_cache(maxsize=4096)
+def _site_of(netloc: str) -> str:
+    """Last two host labels of netloc, used as a cheap registrable-domain key"""
+    host = netloc.rpartition('@')[2].partition(':')[0]
+    rest, _, tld = host.rpartition('.')
+    return f"{rest.rpartition('.')[2]}.{tld}" if rest else host
+
+
 class RequestPatternOptimizer:
     """Advanced request pattern optimization with timing and behavioral randomization"""
     
+    # Navigation Timing keys with their (low, high) offsets from navigationStart in ms
+    _NAV_KEYS = (
+        'navigationStart', 'fetchStart', 'domainLookupStart', 'domainLookupEnd',
+        'connectStart', 'connectEnd', 'requestStart', 'responseStart', 'responseEnd',
+        'domLoading', 'domInteractive', 'domContentLoadedEventStart',
+        'domContentLoadedEventEnd', 'domComplete', 'loadEventStart', 'loadEventEnd'
+    )
+    _NAV_LOWS = np.array([0, 0, 5, 20, 50, 100, 200, 250, 500, 500, 600, 1500, 2000, 2100, 3000, 3100], dtype=np.float64)
+    _NAV_HIGHS = np.array([0, 5, 20, 50, 100, 200, 250, 500, 1000, 600, 1500, 2000, 2100, 3000, 3100, 3200], dtype=np.float64)
+    
+    _PRIORITY_HINTS = ('u=0', 'u=1', 'u=2', 'u=3', 'u=4')
+    
+    # Common Fetch Metadata (Mode, User, Dest) combinations
+    _FETCH_PATTERNS = (
+        ('navigate', '?1', 'document'),
+        ('cors', None, 'empty'),
+        ('no-cors', None, 'image'),
+        ('no-cors', None, 'script'),
+        ('no-cors', None, 'style')
+    )
+    
     def __init__(self):
-        self.request_history = deque(maxlen=1000)
-        self.referrer_chains = {}
+        self.request_history = deque(maxlen=HISTORY_SIZE)
+        # Ring buffer of request timestamps mirroring request_history
+        self._ts = np.empty(HISTORY_SIZE, dtype=np.float64)
+        self._ts_pos = 0
+        self.referrer_chains = OrderedDict()
         self.site_patterns = {}
         
         # Timing patterns for different user types
@@ -57,7 +151,18 @@ class RequestPatternOptimizer:
             }
         }
         
-        self.current_profile = random.choice(list(self.user_profiles.keys()))
+        # Struct-of-arrays view of user_profiles for the delay hot path
+        self._profile_names = tuple(self.user_profiles)
+        self._profile_index = {name: i for i, name in enumerate(self._profile_names)}
+        self._profile_min = np.array([p['min_delay'] for p in self.user_profiles.values()], dtype=np.float64)
+        self._profile_max = np.array([p['max_delay'] for p in self.user_profiles.values()], dtype=np.float64)
+        self._burst_p = np.array([p['burst_probability'] for p in self.user_profiles.values()], dtype=np.float64)
+        self._idle_p = np.array([p['idle_probability'] for p in self.user_profiles.values()], dtype=np.float64)
+        
+        self.current_profile = random.choice(self._profile_names)
+        self._rng = np.random.default_rng()
+        self._rand_buf = self._rng.random(RAND_BUFFER_SIZE).tolist()
+        self._rand_pos = 0
         
         # Resource priority patterns
         self.resource_priorities = ['high', 'medium', 'low', 'auto']
@@ -65,30 +170,49 @@ class RequestPatternOptimizer:
         
         # Request headers variation
         self.header_variations = {
-            'Accept-Encoding': [
+            'Accept-Encoding': (
                 'gzip, deflate, br',
                 'gzip, deflate',
                 'gzip, deflate, br, zstd',
                 'identity'
-            ],
-            'Cache-Control': [
+            ),
+            'Cache-Control': (
                 'no-cache',
                 'max-age=0',
                 'no-cache, no-store, must-revalidate',
                 None  # Sometimes omit
-            ],
-            'Upgrade-Insecure-Requests': ['1', None],
-            'DNT': ['1', None],
-            'Sec-Fetch-Site': ['none', 'same-origin', 'same-site', 'cross-site'],
-            'Sec-Fetch-Mode': ['navigate', 'cors', 'no-cors', 'same-origin'],
-            'Sec-Fetch-User': ['?1', None],
-            'Sec-Fetch-Dest': ['document', 'empty', 'image', 'script', 'style']
+            ),
+            'Upgrade-Insecure-Requests': ('1', None),
+            'DNT': ('1', None),
+            'Sec-Fetch-Site': ('none', 'same-origin', 'same-site', 'cross-site'),
+            'Sec-Fetch-Mode': ('navigate', 'cors', 'no-cors', 'same-origin'),
+            'Sec-Fetch-User': ('?1', None),
+            'Sec-Fetch-Dest': ('document', 'empty', 'image', 'script', 'style')
         }
+        self._hv_items = tuple(self.header_variations.items())
+        self._hv_lens = np.array([len(values) for _, values in self._hv_items], dtype=np.intp)
         
         # Microsecond-level timing jitter
         self.jitter_enabled = True
         self.jitter_range = (0.0001, 0.01)  # 0.1ms to 10ms
         
+        # Pay the JIT compile cost up front rather than on the first batch
+        if NUMBA_AVAILABLE:
+            self.calculate_request_delays([''])
+        
+    def _r(self) -> float:
+        """Next uniform [0, 1) draw from the prefetched buffer"""
+        i = self._rand_pos
+        if i >= RAND_BUFFER_SIZE:
+            self._rand_buf = self._rng.random(RAND_BUFFER_SIZE).tolist()
+            i = 0
+        self._rand_pos = i + 1
+        return self._rand_buf[i]
+    
+    def _u(self, lo: float, hi: float) -> float:
+        """Buffered equivalent of random.uniform(lo, hi)"""
+        return lo + (hi - lo) * self._r()
+    
     def add_timing_jitter(self, base_delay: float = 0) -> float:
         """Add microsecond-level timing jitter to requests"""
         if not self.jitter_enabled:
@@ -98,12 +222,12 @@ class RequestPatternOptimizer:
         total_delay = base_delay
         
         # Add microsecond jitter
-        jitter = random.uniform(*self.jitter_range)
+        jitter = self._u(*self.jitter_range)
         total_delay += jitter
         
         # Occasionally add longer pauses (human-like hesitation)
-        if random.random() < 0.05:  # 5% chance
-            total_delay += random.uniform(0.1, 0.5)
+        if self._r() < 0.05:  # 5% chance
+            total_delay += self._u(0.1, 0.5)
         
         # Log for debugging
         logger.debug(f"Request delay: {total_delay:.4f}s (base: {base_delay:.4f}s, jitter: {jitter:.4f}s)")
@@ -112,53 +236,52 @@ class RequestPatternOptimizer:
     
     def calculate_request_delay(self, url: str, resource_type: str = 'document') -> float:
         """Calculate realistic delay based on user profile and resource type"""
-        profile = self.user_profiles[self.current_profile]
-        
-        # Base delay from profile
-        base_delay = random.uniform(profile['min_delay'], profile['max_delay'])
-        
-        # Adjust for resource type
-        resource_multipliers = {
-            'document': 1.0,
-            'image': 0.1,  # Images load faster
-            'script': 0.2,
-            'style': 0.15,
-            'font': 0.1,
-            'xhr': 0.3,  # AJAX requests
-            'fetch': 0.3,
-            'other': 0.5
-        }
-        
-        base_delay *= resource_multipliers.get(resource_type, 1.0)
-        
-        # Check for burst mode
-        if random.random() < profile['burst_probability']:
-            base_delay *= 0.1  # Much faster during bursts
-        
-        # Check for idle mode
-        if random.random() < profile['idle_probability']:
-            base_delay *= random.uniform(5, 20)  # Much slower when idle
+        return float(self.calculate_request_delays([url], [resource_type])[0])
+    
+    def calculate_request_delays(self, urls: List[str], resource_types: List[str] = None) -> np.ndarray:
+        """Vectorized calculate_request_delay for a batch of URLs"""
+        n = len(urls)
+        i = self._profile_index[self.current_profile]
         
-        # Add jitter
-        return self.add_timing_jitter(base_delay)
+        if resource_types is None:
+            type_idx = np.zeros(n, dtype=np.intp)
+        else:
+            unknown = len(_RESOURCE_MULT)
+            type_idx = np.fromiter(
+                (_RESOURCE_CODE.get(t, unknown) for t in resource_types),
+                dtype=np.intp, count=n
+            )
+        
+        # Rows: base, burst, idle, idle scale, jitter, hesitation, hesitation scale
+        u = self._rng.random((7, n))
+        return _compute_delays(
+            u, _RESOURCE_MULT_ARR[type_idx],
+            self._profile_min[i], self._profile_max[i], self._burst_p[i], self._idle_p[i],
+            self.jitter_range[0], self.jitter_range[1], self.jitter_enabled
+        )
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _entry_points(netloc: str) -> Tuple[Optional[str], ...]:
+        """Candidate first hops for a referrer chain into netloc"""
+        return (
+            f"https://www.google.com/search?q={netloc}",
+            f"https://www.bing.com/search?q={netloc}",
+            f"https://duckduckgo.com/?q={netloc}",
+            f"https://www.reddit.com/search/?q={netloc}",
+            f"https://twitter.com/search?q={netloc}",
+            f"https://{netloc}",  # Direct navigation
+            None  # No referrer (bookmark/typed)
+        )
     
     def build_referrer_chain(self, target_url: str, entry_point: str = None) -> List[str]:
         """Build a realistic referrer chain to target URL"""
         chain = []
-        parsed_target = urlparse(target_url)
+        parsed_target = _cached_urlparse(target_url)
         
         # Determine entry point
         if entry_point is None:
-            entry_points = [
-                f"https://www.google.com/search?q={parsed_target.netloc}",
-                f"https://www.bing.com/search?q={parsed_target.netloc}",
-                f"https://duckduckgo.com/?q={parsed_target.netloc}",
-                f"https://www.reddit.com/search/?q={parsed_target.netloc}",
-                f"https://twitter.com/search?q={parsed_target.netloc}",
-                f"https://{parsed_target.netloc}",  # Direct navigation
-                None  # No referrer (bookmark/typed)
-            ]
-            entry_point = random.choice(entry_points)
+            entry_point = random.choice(self._entry_points(parsed_target.netloc))
         
         if entry_point:
             chain.append(entry_point)
@@ -170,20 +293,24 @@ class RequestPatternOptimizer:
             path_parts = parsed_target.path.strip('/').split('/')
             
             # Sometimes visit homepage first
-            if random.random() < 0.7:
+            if self._r() < 0.7:
                 chain.append(base_url)
             
             # Visit some parent paths
             for i in range(len(path_parts) - 1):
-                if random.random() < 0.5:
+                if self._r() < 0.5:
                     partial_path = '/'.join(path_parts[:i+1])
                     chain.append(f"{base_url}/{partial_path}")
         
         # Add target
         chain.append(target_url)
         
-        # Store chain for future reference
-        self.referrer_chains[target_url] = chain
+        # Store chain for future reference, evicting the oldest beyond the limit
+        chains = self.referrer_chains
+        chains[target_url] = chain
+        chains.move_to_end(target_url)
+        if len(chains) > REFERRER_CHAIN_LIMIT:
+            chains.popitem(last=False)
         
         return chain
     
@@ -191,25 +318,28 @@ class RequestPatternOptimizer:
         """Generate randomized headers while maintaining consistency"""
         headers = base_headers.copy() if base_headers else {}
         
-        # Randomly vary certain headers
-        for header, values in self.header_variations.items():
-            if random.random() < 0.7:  # 70% chance to include
-                value = random.choice(values)
+        # Randomly vary certain headers (70% inclusion), two vector draws per call
+        n = len(self._hv_items)
+        include = (self._rng.random(n) < 0.7).tolist()
+        picks = (self._rng.integers(0, 1 << 30, size=n) % self._hv_lens).tolist()
+        for (header, values), inc, pick in zip(self._hv_items, include, picks):
+            if inc:
+                value = values[pick]
                 if value is not None:
                     headers[header] = value
                 elif header in headers:
                     del headers[header]
         
         # Add priority hints sometimes
-        if random.random() < 0.3:
-            headers['Priority'] = random.choice(['u=0', 'u=1', 'u=2', 'u=3', 'u=4'])
+        if self._r() < 0.3:
+            headers['Priority'] = self._PRIORITY_HINTS[int(self._r() * len(self._PRIORITY_HINTS))]
         
         # Add importance hint sometimes
-        if random.random() < 0.2:
-            headers['Importance'] = random.choice(self.fetch_priorities)
+        if self._r() < 0.2:
+            headers['Importance'] = self.fetch_priorities[int(self._r() * len(self.fetch_priorities))]
         
         # Early hints support
-        if random.random() < 0.1:
+        if self._r() < 0.1:
             headers['Early-Data'] = '1'
         
         return headers
@@ -218,25 +348,10 @@ class RequestPatternOptimizer:
         """Simulate Navigation Timing API data"""
         base_time = time.time() * 1000  # Convert to milliseconds
         
-        # Realistic timing ranges (in ms)
-        timing = {
-            'navigationStart': base_time,
-            'fetchStart': base_time + random.uniform(0, 5),
-            'domainLookupStart': base_time + random.uniform(5, 20),
-            'domainLookupEnd': base_time + random.uniform(20, 50),
-            'connectStart': base_time + random.uniform(50, 100),
-            'connectEnd': base_time + random.uniform(100, 200),
-            'requestStart': base_time + random.uniform(200, 250),
-            'responseStart': base_time + random.uniform(250, 500),
-            'responseEnd': base_time + random.uniform(500, 1000),
-            'domLoading': base_time + random.uniform(500, 600),
-            'domInteractive': base_time + random.uniform(600, 1500),
-            'domContentLoadedEventStart': base_time + random.uniform(1500, 2000),
-            'domContentLoadedEventEnd': base_time + random.uniform(2000, 2100),
-            'domComplete': base_time + random.uniform(2100, 3000),
-            'loadEventStart': base_time + random.uniform(3000, 3100),
-            'loadEventEnd': base_time + random.uniform(3100, 3200)
-        }
+        # Realistic timing ranges (in ms), drawn in one vector call
+        offsets = self._rng.uniform(self._NAV_LOWS, self._NAV_HIGHS)
+        offsets[0] = 0.0
+        timing = dict(zip(self._NAV_KEYS, (base_time + offsets).tolist()))
         
         return timing
     
@@ -244,27 +359,20 @@ class RequestPatternOptimizer:
         """Generate Resource Timing API data"""
         base_time = time.time() * 1000
         
-        # Different timings for different resource types
-        type_delays = {
-            'script': (50, 500),
-            'style': (30, 300),
-            'image': (100, 1000),
-            'font': (20, 200),
-            'fetch': (50, 300),
-            'other': (50, 500)
-        }
+        min_delay, max_delay = _TYPE_DELAYS.get(resource_type, (50, 500))
         
-        min_delay, max_delay = type_delays.get(resource_type, (50, 500))
+        # Duration plus the three sizes in a single draw
+        draws = self._rng.uniform((min_delay, 100, 100, 100), (max_delay, 100001, 50001, 50001))
         
         timing = {
             'name': resource_url,
             'entryType': 'resource',
             'startTime': base_time,
-            'duration': random.uniform(min_delay, max_delay),
+            'duration': float(draws[0]),
             'initiatorType': resource_type,
-            'transferSize': random.randint(100, 100000),
-            'encodedBodySize': random.randint(100, 50000),
-            'decodedBodySize': random.randint(100, 50000)
+            'transferSize': int(draws[1]),
+            'encodedBodySize': int(draws[2]),
+            'decodedBodySize': int(draws[3])
         }
         
         return timing
@@ -279,9 +387,11 @@ class RequestPatternOptimizer:
             'timestamp': timestamp,
             'profile': self.current_profile
         })
+        self._ts[self._ts_pos % HISTORY_SIZE] = timestamp
+        self._ts_pos += 1
         
         # Analyze patterns for the site
-        domain = urlparse(url).netloc
+        domain = _cached_urlparse(url).netloc
         if domain not in self.site_patterns:
             self.site_patterns[domain] = {
                 'request_count': 0,
@@ -295,20 +405,29 @@ class RequestPatternOptimizer:
         pattern['last_request'] = timestamp
         pattern['total_time'] = timestamp - pattern['first_request']
     
+    def _recent_timestamps(self, count: int) -> np.ndarray:
+        """Last `count` tracked timestamps in chronological order"""
+        count = min(count, self._ts_pos, HISTORY_SIZE)
+        end = self._ts_pos % HISTORY_SIZE
+        start = end - count
+        if start >= 0:
+            return self._ts[start:end]
+        return np.concatenate((self._ts[start:], self._ts[:end]))
+    
     def should_take_break(self) -> bool:
         """Determine if we should take a break (human-like behavior)"""
-        if len(self.request_history) < 10:
+        pos = self._ts_pos
+        if pos < 10:
             return False
         
-        recent_requests = list(self.request_history)[-10:]
-        time_span = recent_requests[-1]['timestamp'] - recent_requests[0]['timestamp']
+        time_span = self._ts[(pos - 1) % HISTORY_SIZE] - self._ts[(pos - 10) % HISTORY_SIZE]
         
         # If making requests too fast, take a break
         if time_span < 30:  # 10 requests in 30 seconds
-            return random.random() < 0.7  # 70% chance to break
+            return self._r() < 0.7  # 70% chance to break
         
         # Random breaks for realism
-        return random.random() < 0.1  # 10% chance
+        return self._r() < 0.1  # 10% chance
     
     def get_break_duration(self) -> float:
         """Get duration for a break"""
@@ -323,13 +442,14 @@ class RequestPatternOptimizer:
         weights = [0.5, 0.3, 0.15, 0.05]
         break_type = random.choices(break_types, weights=weights)[0]
         
-        return random.uniform(*break_type)
+        return self._u(*break_type)
     
     def switch_profile(self):
         """Switch to a different user profile"""
-        profiles = list(self.user_profiles.keys())
-        profiles.remove(self.current_profile)
-        self.current_profile = random.choice(profiles)
+        # Pick any index except the current one without building a list
+        current = self._profile_index[self.current_profile]
+        offset = random.randrange(1, len(self._profile_names))
+        self.current_profile = self._profile_names[(current + offset) % len(self._profile_names)]
         logger.info(f"Switched to profile: {self.current_profile}")
     
     def get_request_statistics(self) -> Dict:
@@ -341,41 +461,35 @@ class RequestPatternOptimizer:
             'site_patterns': self.site_patterns
         }
         
-        if self.request_history:
-            recent = list(self.request_history)[-100:]
-            timestamps = [r['timestamp'] for r in recent]
-            if len(timestamps) > 1:
-                intervals = [timestamps[i+1] - timestamps[i] for i in range(len(timestamps)-1)]
-                stats['avg_interval'] = np.mean(intervals)
-                stats['std_interval'] = np.std(intervals)
+        timestamps = self._recent_timestamps(100)
+        if len(timestamps) > 1:
+            intervals = np.diff(timestamps)
+            stats['avg_interval'] = intervals.mean()
+            stats['std_interval'] = intervals.std()
         
         return stats
     
     def generate_fetch_metadata(self, url: str, referrer: str = None) -> Dict:
         """Generate Fetch Metadata headers"""
-        parsed_url = urlparse(url)
-        parsed_referrer = urlparse(referrer) if referrer else None
-        
-        # Determine site relationship
+        # Determine site relationship, cheapest and most common case first
+        netloc = _cached_urlparse(url).netloc
         if not referrer:
             site = 'none'
-        elif parsed_referrer.netloc == parsed_url.netloc:
-            site = 'same-origin'
-        elif parsed_referrer.netloc.endswith(parsed_url.netloc) or parsed_url.netloc.endswith(parsed_referrer.netloc):
-            site = 'same-site'
         else:
-            site = 'cross-site'
-        
-        # Common patterns
-        patterns = [
-            {'Sec-Fetch-Site': site, 'Sec-Fetch-Mode': 'navigate', 'Sec-Fetch-User': '?1', 'Sec-Fetch-Dest': 'document'},
-            {'Sec-Fetch-Site': site, 'Sec-Fetch-Mode': 'cors', 'Sec-Fetch-Dest': 'empty'},
-            {'Sec-Fetch-Site': site, 'Sec-Fetch-Mode': 'no-cors', 'Sec-Fetch-Dest': 'image'},
-            {'Sec-Fetch-Site': site, 'Sec-Fetch-Mode': 'no-cors', 'Sec-Fetch-Dest': 'script'},
-            {'Sec-Fetch-Site': site, 'Sec-Fetch-Mode': 'no-cors', 'Sec-Fetch-Dest': 'style'}
-        ]
-        
-        return random.choice(patterns)
+            referrer_netloc = _cached_urlparse(referrer).netloc
+            if referrer_netloc == netloc:
+                site = 'same-origin'
+            elif _site_of(referrer_netloc) == _site_of(netloc):
+                site = 'same-site'
+            else:
+                site = 'cross-site'
+        
+        mode, user, dest = random.choice(self._FETCH_PATTERNS)
+        headers = {'Sec-Fetch-Site': site, 'Sec-Fetch-Mode': mode}
+        if user:
+            headers['Sec-Fetch-User'] = user
+        headers['Sec-Fetch-Dest'] = dest
+        return headers
 
 # Singleton instance
 request_optimizer = RequestPatternOptimizer()
\ No newline at end of file
@@ -8,7 +8,40 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Callable
 import json
 import os
+import atexit
 import uuid
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+SCHEDULES_FILE = "schedules/scheduled_jobs.json"
+
+# Run-stat updates from _run_job are persisted by a background saver at most
+# this often; user edits (add/pause/resume/delete) still save immediately
+SAVE_INTERVAL = 5.0
+
+# Bounds for the scheduler loop's sleep between run_pending() calls
+MIN_TICK = 0.5
+MAX_TICK = 30.0
+
+# Dispatch tables for schedule's attribute-style API (interval units in priority order)
+_INTERVAL = {
+    "minutes": lambda every: every.minutes,
+    "hours": lambda every: every.hours,
+    "days": lambda every: every.days,
+}
+_WEEKDAY = {
+    "monday": lambda every: every.monday,
+    "tuesday": lambda every: every.tuesday,
+    "wednesday": lambda every: every.wednesday,
+    "thursday": lambda every: every.thursday,
+    "friday": lambda every: every.friday,
+    "saturday": lambda every: every.saturday,
+    "sunday": lambda every: every.sunday,
+}
 
 class ScrapingScheduler:
     """
@@ -21,7 +54,11 @@ class ScrapingScheduler:
         self.scheduler_thread = None
         self.running = False
         self.job_history = []
+        self.saver_thread = None
+        self._dirty = False
+        self._save_lock = threading.Lock()
         self._load_schedules()
+        atexit.register(self._flush_schedules)
     
     def add_schedule(self, 
                      name: str,
@@ -76,18 +113,12 @@ class ScrapingScheduler:
         config = job["schedule_config"]
         
         if schedule_type == "interval":
-            if "minutes" in config:
-                schedule.every(config["minutes"]).minutes.do(
-                    self._run_job, job_id=job["id"]
-                )
-            elif "hours" in config:
-                schedule.every(config["hours"]).hours.do(
-                    self._run_job, job_id=job["id"]
-                )
-            elif "days" in config:
-                schedule.every(config["days"]).days.do(
-                    self._run_job, job_id=job["id"]
-                )
+            for unit, getter in _INTERVAL.items():
+                if unit in config:
+                    getter(schedule.every(config[unit])).do(
+                        self._run_job, job_id=job["id"]
+                    )
+                    break
         
         elif schedule_type == "daily":
             schedule.every().day.at(config["time"]).do(
@@ -95,35 +126,9 @@ class ScrapingScheduler:
             )
         
         elif schedule_type == "weekly":
-            day = config["day"].lower()
-            time_str = config["time"]
-            
-            if day == "monday":
-                schedule.every().monday.at(time_str).do(
-                    self._run_job, job_id=job["id"]
-                )
-            elif day == "tuesday":
-                schedule.every().tuesday.at(time_str).do(
-                    self._run_job, job_id=job["id"]
-                )
-            elif day == "wednesday":
-                schedule.every().wednesday.at(time_str).do(
-                    self._run_job, job_id=job["id"]
-                )
-            elif day == "thursday":
-                schedule.every().thursday.at(time_str).do(
-                    self._run_job, job_id=job["id"]
-                )
-            elif day == "friday":
-                schedule.every().friday.at(time_str).do(
-                    self._run_job, job_id=job["id"]
-                )
-            elif day == "saturday":
-                schedule.every().saturday.at(time_str).do(
-                    self._run_job, job_id=job["id"]
-                )
-            elif day == "sunday":
-                schedule.every().sunday.at(time_str).do(
+            getter = _WEEKDAY.get(config["day"].lower())
+            if getter:
+                getter(schedule.every()).at(config["time"]).do(
                     self._run_job, job_id=job["id"]
                 )
         
@@ -194,8 +199,8 @@ class ScrapingScheduler:
             # Calculate next run
             job["next_run"] = self._calculate_next_run(job)
             
-            # Save updates
-            self._save_schedules()
+            # Persisted by the background saver
+            self._dirty = True
             
         except Exception as e:
             print(f"Error running scheduled job {job_id}: {e}")
@@ -211,10 +216,19 @@ class ScrapingScheduler:
         def run_scheduler():
             while self.running:
                 schedule.run_pending()
-                time.sleep(30)  # Check every 30 seconds
+                # Wake when the next job is due instead of polling on a fixed period
+                idle = schedule.idle_seconds()
+                time.sleep(MAX_TICK if idle is None else min(MAX_TICK, max(MIN_TICK, idle)))
+        
+        def run_saver():
+            while self.running:
+                time.sleep(SAVE_INTERVAL)
+                self._flush_schedules()
         
         self.scheduler_thread = threading.Thread(target=run_scheduler, daemon=True)
         self.scheduler_thread.start()
+        self.saver_thread = threading.Thread(target=run_saver, daemon=True)
+        self.saver_thread.start()
         print("✅ Scheduler started")
     
     def stop(self):
@@ -222,6 +236,7 @@ class ScrapingScheduler:
         self.running = False
         if self.scheduler_thread:
             self.scheduler_thread.join(timeout=5)
+        self._flush_schedules()
         schedule.clear()
         print("Scheduler stopped")
     
@@ -267,13 +282,28 @@ class ScrapingScheduler:
     
     def _save_schedules(self):
         """Save schedules to file"""
-        os.makedirs("schedules", exist_ok=True)
-        with open("schedules/scheduled_jobs.json", "w") as f:
-            json.dump(self.scheduled_jobs, f, indent=2)
+        with self._save_lock:
+            self._dirty = False
+            if ORJSON_AVAILABLE:
+                payload = orjson.dumps(self.scheduled_jobs, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(self.scheduled_jobs, indent=2).encode()
+            
+            # Write-then-rename so a crash mid-save never truncates the file
+            os.makedirs(os.path.dirname(SCHEDULES_FILE), exist_ok=True)
+            tmp = SCHEDULES_FILE + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(payload)
+            os.replace(tmp, SCHEDULES_FILE)
+    
+    def _flush_schedules(self):
+        """Save schedules if job runs have changed them since the last save"""
+        if self._dirty:
+            self._save_schedules()
     
     def _load_schedules(self):
         """Load schedules from file"""
-        filepath = "schedules/scheduled_jobs.json"
+        filepath = SCHEDULES_FILE
         if os.path.exists(filepath):
             try:
                 with open(filepath, "r") as f:
@@ -1,5 +1,8 @@
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
+import lxml.etree
+import lxml.html
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
@@ -7,18 +10,62 @@ from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+from concurrent.futures import ThreadPoolExecutor
+from driver_pool import DriverPool
+from proxy_manager import Proxy, proxy_manager
+from functools import lru_cache
+import atexit
+import os
+import re
 import time
 
+# Shared keep-alive session so repeated hosts reuse TCP/TLS connections
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
+
+_WS_RE = re.compile(r'\s+')
+
+# Bounded pool of warm Chrome instances shared by all threads; each browser
+# is restarted after DRIVER_MAX_USES pages
+DRIVER_POOL_SIZE = int(os.environ.get('SCRAPER_DRIVER_POOL_SIZE', '4'))
+DRIVER_MAX_USES = 50
+
+@lru_cache(maxsize=1)
+def _chromedriver_path():
+    """Resolve ChromeDriver once per process"""
+    return ChromeDriverManager().install()
+
+def _chrome_options():
+    chrome_options = Options()
+    chrome_options.add_argument('--headless')  # Run in headless mode
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    return chrome_options
+
+def _create_driver():
+    return webdriver.Chrome(service=Service(_chromedriver_path()), options=_chrome_options())
+
+_DRIVER_POOL = DriverPool(_create_driver, DRIVER_POOL_SIZE, DRIVER_MAX_USES)
+atexit.register(_DRIVER_POOL.close)
+
 def scrape_static_content(url, proxy=None):
     """
-    Scrape static content from a URL using requests and BeautifulSoup
+    Scrape static content from a URL using requests and lxml
     """
     try:
         # Configure proxy if provided
         proxies = None
         if proxy:
-            # Handle both string and dict proxy formats
-            if isinstance(proxy, dict) and 'http' in proxy:
+            # Handle Proxy entries from proxy_manager, string and dict proxy formats
+            if isinstance(proxy, Proxy):
+                proxies = proxy_manager.get_proxy_dict(proxy)
+            elif isinstance(proxy, dict) and 'http' in proxy:
                 proxies = proxy
             elif isinstance(proxy, str):
                 proxies = {
@@ -36,43 +83,53 @@ def scrape_static_content(url, proxy=None):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
         
-        response = requests.get(url, headers=headers, proxies=proxies, timeout=10)
+        response = _SESSION.get(url, headers=headers, proxies=proxies, timeout=10)
         response.raise_for_status()
         
-        # Parse HTML with BeautifulSoup
-        soup = BeautifulSoup(response.text, 'html.parser')
+        content = response.content
+        if not content.strip():
+            return ''
+        
+        # Parse the raw bytes with lxml so decoding and text extraction stay in C.
+        # Honour a charset declared in Content-Type; requests otherwise reports
+        # ISO-8859-1 for any text/* response, which would override <meta charset>
+        parser = None
+        if response.encoding and 'charset' in response.headers.get('Content-Type', '').lower():
+            parser = lxml.html.HTMLParser(encoding=response.encoding)
+        try:
+            tree = lxml.html.fromstring(content, parser=parser)
+        except lxml.etree.ParserError:
+            # Nothing but whitespace/comments: "Document is empty"
+            return ''
         
         # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
+        for element in tree.xpath('//script|//style'):
+            element.drop_tree()
         
         # Get text content
-        text = soup.get_text()
-        
-        # Clean up text
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk)
+        text = _WS_RE.sub(' ', tree.text_content()).strip()
         
         return text
         
     except Exception as e:
         return f"Error scraping {url}: {str(e)}"
 
+def scrape_static_batch(urls, proxy=None, max_workers=32):
+    """
+    Scrape many static URLs concurrently over the shared session.
+    Results are returned in the same order as urls.
+    """
+    urls = list(urls)
+    if not urls:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        return list(executor.map(lambda url: scrape_static_content(url, proxy), urls))
+
 def scrape_dynamic_content(url, proxy=None):
     """
     Scrape dynamic content from a URL using Selenium
     """
     try:
-        # Configure Chrome options
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')  # Run in headless mode
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        
         # Add proxy if provided
         # Note: Selenium doesn't natively support authenticated proxies
         # For now, we'll skip proxy for dynamic scraping
@@ -80,40 +137,43 @@ def scrape_dynamic_content(url, proxy=None):
         if proxy:
             print("Note: Proxy authentication not supported in dynamic mode without extension")
         
-        # Initialize driver with automatic ChromeDriver management
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        
-        # Navigate to URL
-        driver.get(url)
-        
-        # Wait for page to load (adjust timeout as needed)
-        wait = WebDriverWait(driver, 10)
-        wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-        
-        # Additional wait for JavaScript to complete
-        time.sleep(2)
-        
-        # Get page source
-        page_source = driver.page_source
+        # Borrow a pooled browser; it is reset or retired when handed back
+        driver = _DRIVER_POOL.acquire()
+        try:
+            # Navigate to URL
+            _DRIVER_POOL.navigate(driver, url)
+            
+            # Wait for page to load (adjust timeout as needed)
+            wait = WebDriverWait(driver, 10)
+            wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+            
+            # Additional wait for JavaScript to complete
+            time.sleep(2)
+            
+            # Get page source
+            page_source = driver.page_source
+        except TimeoutException:
+            # A slow page leaves the browser usable
+            _DRIVER_POOL.release(driver)
+            raise
+        except Exception:
+            # Anything else may have killed the browser
+            _DRIVER_POOL.discard(driver)
+            raise
+        _DRIVER_POOL.release(driver)
         
         # Parse with BeautifulSoup
-        soup = BeautifulSoup(page_source, 'html.parser')
+        soup = BeautifulSoup(page_source, 'lxml')
         
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
+        # Remove script and style elements in one selector pass
+        for element in soup.select('script, style'):
+            element.extract()
         
         # Get text content
-        text = soup.get_text()
+        text = soup.get_text(separator=' ', strip=True)
         
         # Clean up text
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk)
-        
-        # Close driver
-        driver.quit()
+        text = _WS_RE.sub(' ', text).strip()
         
         return text
         
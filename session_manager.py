@@ -10,16 +10,24 @@ import time
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 import threading
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 import requests
 from collections import defaultdict
 
+# Threads used to heartbeat sessions in parallel
+HEARTBEAT_WORKERS = 32
+
 class SessionManager:
     """
     Manages persistent browser sessions and authentication states
     """
     
+    # Nudge the page down and back in a single script call
+    _HEARTBEAT_JS = "window.scrollBy(0, 10); window.scrollBy(0, -10);"
+    
     def __init__(self, session_dir: str = "sessions"):
         self.session_dir = session_dir
         os.makedirs(session_dir, exist_ok=True)
@@ -352,9 +360,7 @@ class SessionManager:
         
         try:
             # Perform minimal activity to keep session alive
-            driver.execute_script("window.scrollBy(0, 10);")
-            time.sleep(0.1)
-            driver.execute_script("window.scrollBy(0, -10);")
+            driver.execute_script(self._HEARTBEAT_JS)
             
             # Update activity
             self.session_activity[session_id]['last_active'] = datetime.now()
@@ -370,20 +376,28 @@ class SessionManager:
         
         self.running = True
         
-        def heartbeat_loop():
-            while self.running:
-                for session_id in list(self.active_sessions.keys()):
-                    activity = self.session_activity[session_id]
+        async def heartbeat_loop():
+            loop = asyncio.get_running_loop()
+            with ThreadPoolExecutor(max_workers=HEARTBEAT_WORKERS) as pool:
+                while self.running:
+                    now = datetime.now()
+                    due = []
+                    for session_id in list(self.active_sessions.keys()):
+                        activity = self.session_activity[session_id]
+                        
+                        # Check if session needs heartbeat
+                        if activity['last_active'] and now - activity['last_active'] < timedelta(minutes=5):
+                            due.append(session_id)
                     
-                    # Check if session needs heartbeat
-                    if activity['last_active']:
-                        time_since_active = datetime.now() - activity['last_active']
-                        if time_since_active < timedelta(minutes=5):
-                            self.maintain_session(session_id)
-                
-                time.sleep(interval)
+                    # One WebDriver round-trip per session, all in flight at once
+                    await asyncio.gather(*(
+                        loop.run_in_executor(pool, self.maintain_session, session_id)
+                        for session_id in due
+                    ))
+                    
+                    await asyncio.sleep(interval)
         
-        self.heartbeat_thread = threading.Thread(target=heartbeat_loop, daemon=True)
+        self.heartbeat_thread = threading.Thread(target=lambda: asyncio.run(heartbeat_loop()), daemon=True)
         self.heartbeat_thread.start()
     
     def stop_heartbeat(self):
@@ -40,7 +40,7 @@ def setup_webshare():
         print("\nProxy locations:")
         countries = {}
         for proxy in proxies:
-            country = proxy.get('country', 'Unknown')
+            country = proxy.country
             countries[country] = countries.get(country, 0) + 1
         
         for country, count in sorted(countries.items()):
@@ -51,7 +51,7 @@ def setup_webshare():
         if save == 'y':
             import json
             with open('proxies.json', 'w') as f:
-                json.dump(proxies, f, indent=2)
+                json.dump([proxy._asdict() for proxy in proxies], f, indent=2)
             print("✓ Saved to proxies.json")
         
         # Test a proxy
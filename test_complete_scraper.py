@@ -37,7 +37,7 @@ for i in range(5):
     proxy = manager.get_next_proxy()
     proxy_dict = manager.get_proxy_dict(proxy)
     
-    print(f"\n📍 Request {i+1}: Using session {proxy['session_id']}")
+    print(f"\n📍 Request {i+1}: Using session {proxy.session_id}")
     
     try:
         content = scrape_static_content("http://httpbin.org/ip", proxy=proxy_dict)
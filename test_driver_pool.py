@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Test the shared Chrome driver pool with a fake driver
+"""
+from driver_pool import DriverPool, NoDriverAvailable
+
+
+class FakeDriver:
+    """Records the WebDriver calls the pool makes"""
+
+    def __init__(self):
+        self.current_url = 'about:blank'
+        self.cdp = []
+        self.scripts = 0
+        self.quit_called = False
+        self.frames = []
+
+    def get(self, url):
+        self.current_url = url
+
+    def execute_script(self, script):
+        self.scripts += 1
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp.append((cmd, params))
+        if cmd == 'Page.getFrameTree':
+            return {'frameTree': {
+                'frame': {'securityOrigin': self.current_url.split('/page')[0]},
+                'childFrames': [{'frame': {'securityOrigin': origin}} for origin in self.frames]
+            }}
+        return {}
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_release_clears_every_visited_origin():
+    """Cookies are cleared browser-wide and storage for each origin seen, including frames"""
+    pool = DriverPool(FakeDriver, size=1)
+    driver = pool.acquire()
+    pool.navigate(driver, 'https://a.example/start')
+    pool.navigate(driver, 'https://b.example:8443/page')
+    driver.frames = ['https://ads.example', '://']
+
+    pool.release(driver)
+
+    cleared = {params['origin'] for cmd, params in driver.cdp if cmd == 'Storage.clearDataForOrigin'}
+    assert cleared == {'https://a.example', 'https://b.example:8443', 'https://ads.example'}
+    assert ('Network.clearBrowserCookies', {}) in driver.cdp
+    assert driver.scripts == 1
+    assert driver.current_url == 'about:blank'
+
+    # The next checkout reuses the browser and starts with no remembered origins
+    assert pool.acquire() is driver
+    driver.cdp.clear()
+    driver.frames = []
+    pool.release(driver)
+    cleared = [params['origin'] for cmd, params in driver.cdp if cmd == 'Storage.clearDataForOrigin']
+    assert cleared == []
+
+
+def test_pool_is_bounded_and_retires_worn_drivers():
+    """acquire fails once every slot is checked out; max_uses quits a driver"""
+    pool = DriverPool(FakeDriver, size=1, max_uses=2)
+    driver = pool.acquire()
+    try:
+        pool.acquire(timeout=0.01)
+        assert False, "expected NoDriverAvailable"
+    except NoDriverAvailable:
+        pass
+
+    pool.release(driver)
+    assert pool.acquire() is driver
+    pool.release(driver)
+    assert driver.quit_called
+
+    fresh = pool.acquire()
+    assert fresh is not driver
+    pool.close()
+    assert fresh.quit_called
+
+
+def test_unhealthy_driver_is_discarded():
+    """A driver whose reset fails is quit instead of going back to the pool"""
+    pool = DriverPool(FakeDriver, size=1)
+    driver = pool.acquire()
+
+    def broken(cmd, params):
+        raise RuntimeError("browser gone")
+    driver.execute_cdp_cmd = broken
+
+    pool.release(driver)
+    assert driver.quit_called
+    assert pool.acquire() is not driver
+
+
+if __name__ == '__main__':
+    test_release_clears_every_visited_origin()
+    test_pool_is_bounded_and_retires_worn_drivers()
+    test_unhealthy_driver_is_discarded()
+    print("✅ Driver pool tests passed")
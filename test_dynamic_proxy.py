@@ -23,7 +23,7 @@ manager.fetch_proxies_from_webshare()
 
 # Get a proxy
 proxy = manager.get_next_proxy()
-print(f"Using proxy session: {proxy['session_id']}")
+print(f"Using proxy session: {proxy.session_id}")
 
 # Test dynamic scraping with proxy
 url = "http://httpbin.org/ip"
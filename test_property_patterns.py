@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Test property field extraction patterns
+"""
+import re
+
+from property_patterns import (
+    EXTRACTION_PATTERNS, build_fused_pattern, clean_text, extract_fields
+)
+
+
+def reference_extract(text):
+    """Original extraction: patterns tried one at a time in priority order"""
+    results = {}
+    text = re.sub(r'\s+', ' ', text)
+    for field, patterns in EXTRACTION_PATTERNS.items():
+        for pattern in patterns:
+            match = re.search(pattern, text, re.IGNORECASE)
+            if match:
+                value = re.sub(r'\s+', ' ', match.group(1).strip()).strip(' ,.')
+                if field == "value" and value:
+                    value = float(value.replace(',', ''))
+                results[field] = value
+                break
+    return results
+
+
+SAMPLES = [
+    "Site Name: Harris County Appraisal\nOwner Name: JOHN DOE\nMarket Value: $100,000\nAssessed Value: $80,000",
+    "Owner Address: 12 Elm St\nParcel Number: 123-456\nAssessed Value: $250,000",
+    "Taxpayer: ACME LLC\nFolio: 30-1234\nTax ID: X-9\nLocation: 1 Main St\nTaxable Value: 5,000",
+    "Name: Jane Roe\nProperty Owner: JANE ROE TRUST\nSitus Address: 9 Oak Ave",
+    "Grantee: A\nTaxpayer: B\nName: C\nCurrent Owner: D\nFair Market Value: 7\nTotal Value: 9",
+    "No property data on this page",
+]
+
+
+def test_pattern_priority_beats_position():
+    """A higher-priority pattern later in the text wins over an earlier generic one"""
+    text = SAMPLES[0]
+
+    results = extract_fields(clean_text(text))
+
+    assert results == {
+        'owner': 'JOHN DOE Market Value: $100,000 Assessed Value: $80,000',
+        'value': 80000.0,
+    }
+
+
+def test_overlapping_owner_and_mailing_labels():
+    """'Owner Address' is both an owner and a mailing label; both fields must be found"""
+    results = extract_fields(clean_text(SAMPLES[1]))
+
+    assert results == {
+        'owner': 'Address: 12 Elm St Parcel Number: 123-456 Assessed Value: $250,000',
+        'parcel': '123-456',
+        'mailing': '12 Elm St Parcel Number: 123-456 Assessed Value: $250,000',
+        'value': 250000.0,
+    }
+
+
+def test_matches_reference_extraction():
+    """Fused extraction gives the same fields as trying each pattern in order"""
+    for text in SAMPLES:
+        assert extract_fields(clean_text(text)) == reference_extract(text), text
+
+
+def test_include_limits_patterns():
+    """Prefilter group names restrict which patterns may match"""
+    text = clean_text(SAMPLES[0])
+
+    results = extract_fields(text, frozenset({'owner__3', 'value__1'}))
+
+    assert results == {
+        'owner': 'Harris County Appraisal Owner Name: JOHN DOE Market Value: $100,000 Assessed Value: $80,000',
+        'value': 100000.0,
+    }
+
+
+def test_fused_pattern_per_field():
+    """Each field gets its own regex, and include limits the fused alternatives"""
+    fused = build_fused_pattern(EXTRACTION_PATTERNS)
+    assert set(fused) == set(EXTRACTION_PATTERNS)
+
+    subset = build_fused_pattern(EXTRACTION_PATTERNS, frozenset({'mailing__0'}))
+    assert list(subset) == ['mailing']
+    match = subset['mailing'].search("owner address: 12 Elm St")
+    assert match.lastgroup == 'mailing__0'
+    assert match.group(match.lastgroup) == '12 Elm St'
+
+
+if __name__ == '__main__':
+    test_pattern_priority_beats_position()
+    test_overlapping_owner_and_mailing_labels()
+    test_matches_reference_extraction()
+    test_include_limits_patterns()
+    test_fused_pattern_per_field()
+    print("✅ Property pattern tests passed")
@@ -24,14 +24,13 @@ tested = 0
 working = 0
 
 for i, proxy in enumerate(manager.proxies[:10]):
-    print(f"\n🔍 Testing proxy {i+1}: {proxy['address']}:{proxy['port']} ({proxy['country']})")
-    print(f"   Username: {proxy['username']}")
-    print(f"   Valid status: {proxy.get('valid', 'Unknown')}")
+    print(f"\n🔍 Testing proxy {i+1}: {proxy.address}:{proxy.port} ({proxy.country})")
+    print(f"   Username: {proxy.username}")
     
     # Build proxy dict
     proxy_dict = {
-        'http': proxy['url'],
-        'https': proxy['url']
+        'http': proxy.url,
+        'https': proxy.url
     }
     
     # Test against different sites
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test the recipe store: append log, reload, legacy migration and compaction
+"""
+import json
+import os
+import tempfile
+
+from recipe_manager import RecipeManager, RECIPE_STORE, COMPACT_THRESHOLD
+
+
+def _store_lines(storage_path):
+    with open(os.path.join(storage_path, RECIPE_STORE), 'rb') as f:
+        return f.read().splitlines()
+
+
+def test_create_update_delete_reload():
+    """Updates and deletes survive a reload from the store"""
+    with tempfile.TemporaryDirectory() as storage_path:
+        manager = RecipeManager(storage_path)
+        kept = manager.create_recipe("Kept", {"strategy": "auto", "tags": ["shop"]})
+        dropped = manager.create_recipe("Dropped", {"strategy": "static"})
+        manager.update_recipe(kept["id"], {"name": "Renamed", "config": {"strategy": "dynamic"}})
+        assert manager.delete_recipe(dropped["id"])
+        assert not manager.delete_recipe(dropped["id"])
+
+        reloaded = RecipeManager(storage_path)
+        assert list(reloaded.recipes) == [kept["id"]]
+        recipe = reloaded.get_recipe(kept["id"])
+        assert recipe["name"] == "Renamed"
+        assert recipe["config"] == {"strategy": "dynamic", "tags": ["shop"]}
+        assert reloaded.get_recipe(dropped["id"]) is None
+        assert reloaded.get_recipe_by_name("Renamed")["id"] == kept["id"]
+        assert [r["id"] for r in reloaded.search_recipes("shop")] == [kept["id"]]
+
+
+def test_legacy_files_migrate():
+    """Per-recipe JSON files are folded into the store on first load"""
+    with tempfile.TemporaryDirectory() as storage_path:
+        legacy = {
+            "id": "legacy-1",
+            "name": "Legacy",
+            "config": {"strategy": "auto"},
+            "created_at": "2024-01-01T00:00:00",
+            "updated_at": "2024-01-01T00:00:00",
+            "usage_count": 3,
+            "last_used": None,
+            "success_rate": 0,
+            "tags": []
+        }
+        with open(os.path.join(storage_path, "legacy-1.json"), 'w') as f:
+            json.dump(legacy, f, indent=2)
+
+        manager = RecipeManager(storage_path)
+        assert manager.get_recipe("legacy-1") == legacy
+        assert len(_store_lines(storage_path)) == 1
+
+        # The store now wins over the legacy file
+        manager.update_recipe("legacy-1", {"name": "Migrated"})
+        assert RecipeManager(storage_path).get_recipe("legacy-1")["name"] == "Migrated"
+
+
+def test_compaction_drops_stale_records():
+    """Superseded and deleted records are rewritten away once they pile up"""
+    with tempfile.TemporaryDirectory() as storage_path:
+        manager = RecipeManager(storage_path)
+        kept = manager.create_recipe("Kept", {"strategy": "auto"})
+        dropped = manager.create_recipe("Dropped", {"strategy": "auto"})
+        for i in range(COMPACT_THRESHOLD):
+            manager.update_recipe(kept["id"], {"config": {"page": i}})
+        manager.delete_recipe(dropped["id"])
+        assert len(_store_lines(storage_path)) == COMPACT_THRESHOLD + 3
+
+        reloaded = RecipeManager(storage_path)
+        assert len(_store_lines(storage_path)) == 1
+        assert list(reloaded.recipes) == [kept["id"]]
+        assert reloaded.get_recipe(kept["id"])["config"]["page"] == COMPACT_THRESHOLD - 1
+
+        # The compacted store reloads to the same recipe
+        again = RecipeManager(storage_path)
+        assert again.get_recipe(kept["id"]) == reloaded.get_recipe(kept["id"])
+
+
+if __name__ == '__main__':
+    test_create_update_delete_reload()
+    test_legacy_files_migrate()
+    test_compaction_drops_stale_records()
+    print("✅ Recipe store tests passed")
@@ -28,13 +28,13 @@ if proxies:
     print("\n📍 Proxy Locations:")
     countries = {}
     for proxy in proxies[:10]:  # Show first 10
-        country = proxy.get('country', 'Unknown')
+        country = proxy.country
         countries[country] = countries.get(country, 0) + 1
-        print(f"  • {proxy['address']}:{proxy['port']} ({country})")
+        print(f"  • {proxy.address}:{proxy.port} ({country})")
     
     # Save to file
     with open('proxies.json', 'w') as f:
-        json.dump(proxies, f, indent=2)
+        json.dump([proxy._asdict() for proxy in proxies], f, indent=2)
     print(f"\n💾 Saved {len(proxies)} proxies to proxies.json")
     
     # Test a proxy